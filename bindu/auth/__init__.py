@@ -9,10 +9,16 @@ from __future__ import annotations as _annotations
 from bindu.auth.hydra.client import HydraClient
 from bindu.auth.hydra.registration import (
     register_agent_in_hydra,
+    register_agents_in_hydra,
     load_agent_credentials,
     save_agent_credentials,
 )
-from bindu.common.models import TokenIntrospectionResult, OAuthClient, AgentCredentials
+from bindu.common.models import (
+    AgentCredentials,
+    AgentRegistration,
+    OAuthClient,
+    TokenIntrospectionResult,
+)
 
 __all__ = [
     # Hydra
@@ -21,7 +27,9 @@ __all__ = [
     "OAuthClient",
     # Hydra Registration
     "AgentCredentials",
+    "AgentRegistration",
     "register_agent_in_hydra",
+    "register_agents_in_hydra",
     "load_agent_credentials",
     "save_agent_credentials",
 ]
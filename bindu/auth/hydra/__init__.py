@@ -9,6 +9,7 @@ from bindu.auth.hydra.registration import (
     AgentCredentials,
     load_agent_credentials,
     register_agent_in_hydra,
+    register_agents_in_hydra,
     save_agent_credentials,
 )
 
@@ -17,5 +18,6 @@ __all__ = [
     "AgentCredentials",
     "load_agent_credentials",
     "register_agent_in_hydra",
+    "register_agents_in_hydra",
     "save_agent_credentials",
 ]
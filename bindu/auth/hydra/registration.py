@@ -6,56 +6,173 @@ in Ory Hydra during the bindufy process.
 
 from __future__ import annotations as _annotations
 
-import json
-import secrets
+import asyncio
+import base64
+import mmap
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from bindu.auth.hydra.client import HydraClient
-from bindu.common.models import AgentCredentials
+from bindu.common.models import AgentCredentials, AgentRegistration
 from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
+from bindu.utils.vault_client import VaultClient
 
 logger = get_logger("bindu.auth.hydra_registration")
 
+# Parsed credentials files keyed by path, invalidated by (mtime_ns, size)
+_CREDS_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
 
-def save_agent_credentials(
-    credentials: AgentCredentials, credentials_dir: Path
+# Credentials files at least this large are parsed via mmap
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _read_credentials_file(creds_file: Path) -> dict:
+    """Return the parsed credentials file, reusing the in-process cache.
+
+    The file is only re-read and re-parsed when its mtime or size changed
+    since the last read or write from this process. Large files are parsed
+    from a read-only memory map to avoid copying them into a bytes object.
+
+    Args:
+        creds_file: Credentials file to read
+
+    Returns:
+        Mapping of DID to serialized credentials
+
+    Raises:
+        FileNotFoundError: If the credentials file does not exist
+    """
+    st = creds_file.stat()
+    token = (st.st_mtime_ns, st.st_size)
+
+    cached = _CREDS_CACHE.get(creds_file)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+
+    with open(creds_file, "rb") as f:
+        if st.st_size >= _MMAP_THRESHOLD:
+            # Parse straight from the page cache instead of copying into bytes
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                all_creds = orjson.loads(memoryview(mm))
+        else:
+            all_creds = orjson.loads(f.read())
+
+    _CREDS_CACHE[creds_file] = (token, all_creds)
+    return all_creds
+
+
+def _write_credentials_file(creds_file: Path, all_creds: dict) -> None:
+    """Atomically replace the credentials file with ``all_creds``.
+
+    The mapping is serialized up front and written with a single ``write()``
+    to a sibling temp file, which is then renamed over the target so a crash
+    mid-write never leaves a truncated file behind. ``fsync`` is only issued
+    when ``app_settings.hydra.durable_writes`` is set.
+
+    Args:
+        creds_file: Destination credentials file
+        all_creds: Mapping of DID to serialized credentials
+    """
+    # Sorted keys keep the file byte-stable for identical contents
+    payload = orjson.dumps(all_creds, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    tmp_file = creds_file.with_suffix(".json.tmp")
+
+    # Remove any temp file left by a crashed write so O_EXCL always creates a
+    # fresh file with restrictive permissions (owner read/write only)
+    tmp_file.unlink(missing_ok=True)
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        os.write(fd, payload)
+        if app_settings.hydra.durable_writes:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    os.replace(tmp_file, creds_file)
+
+    # Prime the cache with what we just wrote so the next read skips parsing
+    st = creds_file.stat()
+    _CREDS_CACHE[creds_file] = ((st.st_mtime_ns, st.st_size), all_creds)
+
+
+def _create_hydra_client() -> HydraClient:
+    """Create a Hydra client from the configured settings.
+
+    Returns:
+        Hydra client; the caller is responsible for closing it
+    """
+    return HydraClient(
+        admin_url=app_settings.hydra.admin_url,
+        public_url=app_settings.hydra.public_url,
+        timeout=app_settings.hydra.timeout,
+        verify_ssl=app_settings.hydra.verify_ssl,
+        max_retries=app_settings.hydra.max_retries,
+    )
+
+
+def _save_credentials(
+    credentials: list[AgentCredentials], credentials_dir: Path
 ) -> None:
-    """Save agent OAuth credentials to .bindu directory.
+    """Merge credentials into the credentials file with a single write.
 
-    Credentials are keyed by DID (client_id) instead of agent_id because
-    agent_id changes on reload but DID remains stable.
+    The write is skipped entirely when every entry already matches what is on
+    disk, e.g. when re-registering an agent whose credentials are unchanged.
 
     Args:
         credentials: Agent credentials to save
         credentials_dir: Directory to save credentials (typically .bindu)
     """
-    credentials_dir.mkdir(exist_ok=True, parents=True)
+    credentials_dir.mkdir(mode=0o700, exist_ok=True, parents=True)
     creds_file = credentials_dir / "oauth_credentials.json"
 
     # Load existing credentials if file exists
     existing_creds = {}
-    if creds_file.exists():
-        try:
-            with open(creds_file, "r") as f:
-                existing_creds = json.load(f)
-        except Exception as e:
-            logger.warning(f"Failed to load existing credentials: {e}")
+    try:
+        # Copy so the cached mapping is never mutated in place
+        existing_creds = dict(_read_credentials_file(creds_file))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to load existing credentials: {e}")
 
     # Update with new credentials - use DID (client_id) as key for stability
-    existing_creds[credentials.client_id] = credentials.to_dict()
+    changed = False
+    for creds in credentials:
+        entry = creds.to_dict()
+        if existing_creds.get(creds.client_id) != entry:
+            existing_creds[creds.client_id] = entry
+            changed = True
 
-    # Save to file
-    with open(creds_file, "w") as f:
-        json.dump(existing_creds, f, indent=2)
+    if not changed:
+        logger.debug(f"OAuth credentials in {creds_file} unchanged, skipping write")
+        return
 
-    # Set restrictive permissions (owner read/write only)
-    creds_file.chmod(0o600)
+    _write_credentials_file(creds_file, existing_creds)
 
-    logger.info(f"✅ OAuth credentials saved to {creds_file}")
-    logger.warning(f"⚠️  Keep {creds_file} secure and add to .gitignore!")
+    logger.info(
+        "✅ OAuth credentials saved to {} (keep it secure and add to .gitignore!)",
+        creds_file,
+    )
+
+
+def save_agent_credentials(
+    credentials: AgentCredentials, credentials_dir: Path
+) -> None:
+    """Save agent OAuth credentials to .bindu directory.
+
+    Credentials are keyed by DID (client_id) instead of agent_id because
+    agent_id changes on reload but DID remains stable.
+
+    Args:
+        credentials: Agent credentials to save
+        credentials_dir: Directory to save credentials (typically .bindu)
+    """
+    _save_credentials([credentials], credentials_dir)
 
 
 def load_agent_credentials(
@@ -75,217 +192,189 @@ def load_agent_credentials(
     """
     creds_file = credentials_dir / "oauth_credentials.json"
 
-    if not creds_file.exists():
-        return None
-
     try:
-        with open(creds_file, "r") as f:
-            all_creds = json.load(f)
+        all_creds = _read_credentials_file(creds_file)
 
         # Look up by DID (client_id)
-        if did not in all_creds:
+        entry = all_creds.get(did)
+        if entry is None:
             return None
 
-        return AgentCredentials.from_dict(all_creds[did])
+        return AgentCredentials.from_dict(entry)
+    except FileNotFoundError:
+        return None
     except Exception as e:
         logger.error(f"Failed to load credentials for {did}: {e}")
 
     return None
 
 
-async def register_agent_in_hydra(
-    agent_id: str,
-    agent_name: str,
-    agent_url: str,
-    did: str,
+def _has_local_credentials(did: str, credentials_dir: Path) -> bool:
+    """Return whether the credentials file has an entry for ``did``.
+
+    Unlike :func:`load_agent_credentials` this only checks the (cached) parsed
+    mapping and never builds an ``AgentCredentials`` or logs on failure.
+
+    Args:
+        did: Agent DID (used as client_id)
+        credentials_dir: Directory containing credentials
+
+    Returns:
+        True if an entry exists, False otherwise
+    """
+    try:
+        return did in _read_credentials_file(credentials_dir / "oauth_credentials.json")
+    except Exception:
+        return False
+
+
+async def _register_agent(
+    hydra: HydraClient,
+    vault: Optional[VaultClient],
+    registration: AgentRegistration,
     credentials_dir: Path,
-    did_extension=None,
+    to_save: dict[str, AgentCredentials],
+    to_backup: dict[str, AgentCredentials],
+    registered_at: str,
+    scope: str,
 ) -> Optional[AgentCredentials]:
-    """Register agent as OAuth client in Hydra using DID-based authentication.
+    """Register a single agent as OAuth client in Hydra.
+
+    Credentials that need writing to the local file or backing up to Vault are
+    collected in ``to_save`` / ``to_backup`` (keyed by DID) rather than being
+    persisted immediately, so a batch can flush them once.
 
     Args:
-        agent_id: Unique agent identifier
-        agent_name: Human-readable agent name
-        agent_url: Agent's deployment URL
-        did: Agent's DID
-        credentials_dir: Directory to save credentials
-        did_extension: DIDExtension instance for public key extraction (optional)
+        hydra: Hydra client shared by the batch
+        vault: Vault client shared by the batch, or None if Vault is disabled
+        registration: Agent to register
+        credentials_dir: Directory containing saved credentials
+        to_save: Collects credentials to write to the local file
+        to_backup: Collects credentials to back up to Vault
+        registered_at: ISO timestamp recorded as the registration/creation time
+        scope: Space-separated default agent scopes
 
     Returns:
         AgentCredentials if successful, None otherwise
     """
-    # Check if auto-registration is enabled
-    if not app_settings.hydra.auto_register_agents:
-        logger.info("Hydra auto-registration disabled, skipping")
-        return None
+    agent_id = registration.agent_id
+    agent_name = registration.agent_name
+    agent_url = registration.agent_url
+    did = registration.did
+    did_extension = registration.did_extension
 
     # Use DID as client_id for hybrid authentication
     client_id = did
-    client_secret = secrets.token_urlsafe(32)
+    # Same encoding as secrets.token_urlsafe(32), minus the wrapper calls
+    client_secret = (
+        base64.urlsafe_b64encode(os.urandom(32)).rstrip(b"=").decode("ascii")
+    )
 
     # Create OAuth client in Hydra
     try:
-        async with HydraClient(
-            admin_url=app_settings.hydra.admin_url,
-            public_url=app_settings.hydra.public_url,
-            timeout=app_settings.hydra.timeout,
-            verify_ssl=app_settings.hydra.verify_ssl,
-            max_retries=app_settings.hydra.max_retries,
-        ) as hydra:
-            # Priority 1: Check Vault for existing credentials if enabled
-            vault_creds = None
-            if app_settings.vault.enabled:
-                from bindu.utils.vault_client import VaultClient
-
-                vault = VaultClient()
-                try:
-                    vault_creds = await vault.get_hydra_credentials(did)
-
-                    if vault_creds:
-                        logger.info(
-                            f"✅ Found Hydra credentials in Vault for DID: {did}"
-                        )
-
-                        # Verify the client still exists in Hydra
-                        existing_client = await hydra.get_oauth_client(
-                            vault_creds.client_id
-                        )
-                        if existing_client:
-                            logger.info(
-                                f"✅ Hydra client verified in server: {vault_creds.client_id}"
-                            )
-                            # Save to local file as backup
-                            save_agent_credentials(vault_creds, credentials_dir)
-                            return vault_creds
-                        else:
-                            logger.warning(
-                                "Vault credentials exist but client not found in Hydra. "
-                                "Will recreate client with same credentials..."
-                            )
-                            # We'll recreate the client below using vault credentials
-                            client_secret = vault_creds.client_secret
-                finally:
-                    await vault.close()
-
-            # Priority 2: Check if client already exists in Hydra
-            existing_client = await hydra.get_oauth_client(client_id)
-
-            if existing_client:
-                # Client exists in Hydra - check local credentials
-                existing_creds = load_agent_credentials(did, credentials_dir)
-                if existing_creds:
-                    logger.info(f"OAuth credentials verified for DID: {did}")
-
-                    # Backup to Vault if enabled and not already there
-                    if app_settings.vault.enabled and not vault_creds:
-                        from bindu.utils.vault_client import VaultClient
-
-                        vault2 = VaultClient()
-                        try:
-                            await vault2.store_hydra_credentials(existing_creds)
-                        finally:
-                            await vault2.close()
-
-                    return existing_creds
-                elif vault_creds:
-                    # We have vault creds and client exists, use vault creds
-                    logger.info(
-                        f"Using Vault credentials for existing Hydra client: {did}"
-                    )
-                    save_agent_credentials(vault_creds, credentials_dir)
-                    return vault_creds
-                else:
-                    # Client exists in Hydra but no credentials anywhere - delete and recreate
-                    logger.warning(
-                        f"Client {client_id} exists in Hydra but no credentials found. "
-                        "Deleting and recreating..."
-                    )
-                    await hydra.delete_oauth_client(client_id)
-            else:
-                # Client doesn't exist in Hydra
-                if vault_creds:
-                    # Use vault credentials to recreate client
-                    logger.info(
-                        f"Recreating Hydra client with Vault credentials for DID: {did}"
-                    )
-                    client_secret = vault_creds.client_secret
-                else:
-                    # Check if we have stale local credentials
-                    existing_creds = load_agent_credentials(did, credentials_dir)
-                    if existing_creds:
-                        logger.warning(
-                            f"Local credentials exist for {did} but client not found in Hydra. "
-                            "Creating new client..."
-                        )
-
-            # Extract public key from DID extension if available
-            public_key = None
-            key_type = None
-            if did_extension:
-                try:
-                    public_key = did_extension.public_key_base58
-                    key_type = "Ed25519"
-                    logger.info(
-                        f"Extracted public key (base58) from DID extension for {did}"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to extract public key from DID extension: {e}"
-                    )
-
-            # Create new OAuth client with DID metadata
-            client_data = {
-                "client_id": client_id,  # DID is the client_id
-                "client_secret": client_secret,
-                "client_name": agent_name,
-                "grant_types": app_settings.hydra.default_grant_types,
-                "response_types": ["code", "token"],
-                "scope": " ".join(app_settings.hydra.default_agent_scopes),
-                "token_endpoint_auth_method": "client_secret_post",
-                "metadata": {
-                    "agent_id": agent_id,
-                    "agent_url": agent_url,
-                    "did": did,
-                    "public_key": public_key,
-                    "key_type": key_type,
-                    "verification_method": app_settings.did.verification_key_type
-                    if key_type
-                    else None,
-                    "registered_at": datetime.now(timezone.utc).isoformat(),
-                    "hybrid_auth": True,  # Flag for hybrid OAuth2 + DID authentication
-                },
-            }
-
-            await hydra.create_oauth_client(client_data)
-            logger.info(f"✅ Agent registered in Hydra: {client_id}")
-
-            # Create and save credentials
-            credentials = AgentCredentials(
-                agent_id=agent_id,
-                client_id=client_id,
-                client_secret=client_secret,
-                created_at=datetime.now(timezone.utc).isoformat(),
-                scopes=app_settings.hydra.default_agent_scopes,
+        # Priority 1: Check Vault for existing credentials if enabled
+        vault_creds = None
+        if vault is not None:
+            vault_creds = await vault.get_hydra_credentials(did)
+            if vault_creds:
+                logger.info(f"✅ Found Hydra credentials in Vault for DID: {did}")
+
+        # Priority 2: Check if client already exists in Hydra (single lookup)
+        existing_client = await hydra.get_oauth_client(client_id)
+
+        if existing_client:
+            if vault_creds:
+                logger.info(f"✅ Hydra client verified in server: {client_id}")
+                # Save to local file as backup
+                to_save[did] = vault_creds
+                return vault_creds
+
+            # Client exists in Hydra - check local credentials
+            existing_creds = load_agent_credentials(did, credentials_dir)
+            if existing_creds:
+                logger.info(f"OAuth credentials verified for DID: {did}")
+
+                # Backup to Vault if enabled (not there, or it would have matched)
+                if app_settings.vault.enabled:
+                    to_backup[did] = existing_creds
+
+                return existing_creds
+
+            # Client exists in Hydra but no credentials anywhere - delete and recreate
+            logger.warning(
+                f"Client {client_id} exists in Hydra but no credentials found. "
+                "Deleting and recreating..."
             )
+            await hydra.delete_oauth_client(client_id)
+        elif vault_creds:
+            # Client doesn't exist in Hydra - recreate it with Vault credentials
+            logger.warning(
+                "Vault credentials exist but client not found in Hydra. "
+                f"Recreating client with same credentials for DID: {did}"
+            )
+            client_secret = vault_creds.client_secret
+        else:
+            # Check if we have stale local credentials (only used for the warning)
+            if _has_local_credentials(did, credentials_dir):
+                logger.warning(
+                    f"Local credentials exist for {did} but client not found in Hydra. "
+                    "Creating new client..."
+                )
+
+        # Extract public key from DID extension if available
+        public_key = None
+        key_type = None
+        if did_extension:
+            try:
+                public_key = did_extension.public_key_base58
+                key_type = "Ed25519"
+                logger.info(
+                    f"Extracted public key (base58) from DID extension for {did}"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to extract public key from DID extension: {e}")
+
+        # Create new OAuth client with DID metadata
+        client_data = {
+            "client_id": client_id,  # DID is the client_id
+            "client_secret": client_secret,
+            "client_name": agent_name,
+            "grant_types": app_settings.hydra.default_grant_types,
+            "response_types": ["code", "token"],
+            "scope": scope,
+            "token_endpoint_auth_method": "client_secret_post",
+            "metadata": {
+                "agent_id": agent_id,
+                "agent_url": agent_url,
+                "did": did,
+                "public_key": public_key,
+                "key_type": key_type,
+                "verification_method": app_settings.did.verification_key_type
+                if key_type
+                else None,
+                "registered_at": registered_at,
+                "hybrid_auth": True,  # Flag for hybrid OAuth2 + DID authentication
+            },
+        }
+
+        await hydra.create_oauth_client(client_data)
+        logger.info(f"✅ Agent registered in Hydra: {client_id}")
+
+        # Create and save credentials
+        credentials = AgentCredentials(
+            agent_id=agent_id,
+            client_id=client_id,
+            client_secret=client_secret,
+            created_at=registered_at,
+            scopes=app_settings.hydra.default_agent_scopes,
+        )
 
-            # Save to local file
-            save_agent_credentials(credentials, credentials_dir)
-
-            # Backup to Vault if enabled
-            if app_settings.vault.enabled:
-                from bindu.utils.vault_client import VaultClient
-
-                vault3 = VaultClient()
-                try:
-                    vault_stored = await vault3.store_hydra_credentials(credentials)
-                    if vault_stored:
-                        logger.info("✅ Hydra credentials backed up to Vault")
-                    else:
-                        logger.warning("⚠️  Failed to backup Hydra credentials to Vault")
-                finally:
-                    await vault3.close()
+        # Save to local file and backup to Vault if enabled
+        to_save[did] = credentials
+        if app_settings.vault.enabled:
+            to_backup[did] = credentials
 
-            return credentials
+        return credentials
 
     except Exception as e:
         logger.error(f"Failed to register agent in Hydra: {e}")
@@ -294,3 +383,165 @@ async def register_agent_in_hydra(
             "Authentication may not work correctly."
         )
         return None
+
+
+async def _backup_to_vault(
+    vault: VaultClient, to_backup: dict[str, AgentCredentials]
+) -> None:
+    """Back up credentials to Vault concurrently over the shared client.
+
+    Args:
+        vault: Vault client shared by the batch
+        to_backup: Credentials to back up, keyed by DID
+    """
+    stored = await asyncio.gather(
+        *(vault.store_hydra_credentials(c) for c in to_backup.values())
+    )
+    for did, vault_stored in zip(to_backup, stored):
+        if vault_stored:
+            logger.info(f"✅ Hydra credentials backed up to Vault for DID: {did}")
+        else:
+            logger.warning(
+                f"⚠️  Failed to backup Hydra credentials to Vault for DID: {did}"
+            )
+
+
+async def _flush_registrations(
+    credentials_dir: Path,
+    to_save: dict[str, AgentCredentials],
+    to_backup: dict[str, AgentCredentials],
+    vault: Optional[VaultClient],
+) -> None:
+    """Persist credentials collected during registration.
+
+    All credentials are merged into the local file with a single write, run in
+    a worker thread so it does not block the event loop, while Vault backups
+    proceed concurrently.
+
+    Args:
+        credentials_dir: Directory to save credentials
+        to_save: Credentials to write to the local file
+        to_backup: Credentials to back up to Vault
+        vault: Vault client shared by the batch, or None if Vault is disabled
+    """
+    tasks = []
+    if to_save:
+        tasks.append(
+            asyncio.to_thread(
+                _save_credentials, list(to_save.values()), credentials_dir
+            )
+        )
+    if to_backup and vault is not None:
+        tasks.append(_backup_to_vault(vault, to_backup))
+
+    await asyncio.gather(*tasks)
+
+
+async def register_agents_in_hydra(
+    registrations: list[AgentRegistration], credentials_dir: Path
+) -> list[Optional[AgentCredentials]]:
+    """Register several agents as OAuth clients in Hydra.
+
+    Hydra and Vault calls for all agents run concurrently over one client
+    each, closed before returning, and the resulting credentials are flushed
+    once at the end: one write of the local credentials file and one batch
+    of Vault backups.
+
+    Args:
+        registrations: Agents to register
+        credentials_dir: Directory to save credentials
+
+    Returns:
+        AgentCredentials (or None on failure) for each registration, in order
+    """
+    # Check if auto-registration is enabled
+    if not app_settings.hydra.auto_register_agents:
+        logger.info("Hydra auto-registration disabled, skipping")
+        return [None] * len(registrations)
+
+    to_save: dict[str, AgentCredentials] = {}
+    to_backup: dict[str, AgentCredentials] = {}
+
+    # One timestamp and scope string for the whole batch
+    registered_at = datetime.now(timezone.utc).isoformat()
+    scope = " ".join(app_settings.hydra.default_agent_scopes)
+
+    hydra: Optional[HydraClient] = None
+    vault: Optional[VaultClient] = None
+    try:
+        try:
+            hydra = _create_hydra_client()
+            if app_settings.vault.enabled:
+                vault = VaultClient()
+        except Exception as e:
+            logger.error(f"Failed to register agent in Hydra: {e}")
+            logger.warning(
+                "Agents will start without OAuth credentials. "
+                "Authentication may not work correctly."
+            )
+            return [None] * len(registrations)
+
+        results = await asyncio.gather(
+            *(
+                _register_agent(
+                    hydra,
+                    vault,
+                    registration,
+                    credentials_dir,
+                    to_save,
+                    to_backup,
+                    registered_at,
+                    scope,
+                )
+                for registration in registrations
+            )
+        )
+
+        try:
+            await _flush_registrations(credentials_dir, to_save, to_backup, vault)
+        except Exception as e:
+            logger.error(f"Failed to persist Hydra credentials: {e}")
+            logger.warning(
+                "Agents will start without OAuth credentials. "
+                "Authentication may not work correctly."
+            )
+            return [None] * len(registrations)
+    finally:
+        if hydra is not None:
+            await hydra.close()
+        if vault is not None:
+            await vault.close()
+
+    return list(results)
+
+
+async def register_agent_in_hydra(
+    agent_id: str,
+    agent_name: str,
+    agent_url: str,
+    did: str,
+    credentials_dir: Path,
+    did_extension=None,
+) -> Optional[AgentCredentials]:
+    """Register agent as OAuth client in Hydra using DID-based authentication.
+
+    Args:
+        agent_id: Unique agent identifier
+        agent_name: Human-readable agent name
+        agent_url: Agent's deployment URL
+        did: Agent's DID
+        credentials_dir: Directory to save credentials
+        did_extension: DIDExtension instance for public key extraction (optional)
+
+    Returns:
+        AgentCredentials if successful, None otherwise
+    """
+    registration = AgentRegistration(
+        agent_id=agent_id,
+        agent_name=agent_name,
+        agent_url=agent_url,
+        did=did,
+        did_extension=did_extension,
+    )
+    (credentials,) = await register_agents_in_hydra([registration], credentials_dir)
+    return credentials
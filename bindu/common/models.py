@@ -329,3 +329,14 @@ class AgentCredentials:
             created_at=data["created_at"],
             scopes=data.get("scopes", []),
         )
+
+
+@dataclass(frozen=True)
+class AgentRegistration:
+    """Agent details needed to register it as an OAuth client in Hydra."""
+
+    agent_id: str
+    agent_name: str
+    agent_url: str
+    did: str
+    did_extension: DIDAgentExtension | None = None
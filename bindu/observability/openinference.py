@@ -18,10 +18,17 @@ to avoid double instrumentation when frameworks use other frameworks internally.
 
 from __future__ import annotations
 
+import contextvars
+import functools
 import importlib
+import os
+import re
 import sys
-from importlib.metadata import distributions
-from pathlib import Path
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as dist_version
 from typing import Any
 
 from packaging import version
@@ -70,6 +77,31 @@ SUPPORTED_FRAMEWORKS = [
     ),
 ]
 
+# Minimum versions parsed once at import rather than on every setup()
+_MIN_VERSIONS = {
+    spec.framework: version.parse(spec.min_version) for spec in SUPPORTED_FRAMEWORKS
+}
+
+# Known backends recognised in OTLP endpoints, matched in a single scan
+_ENDPOINT_TAG_RE = re.compile(r"langfuse|phoenix|arize|:6006", re.IGNORECASE)
+
+_EXPORT_HINTS = {
+    "langfuse": {
+        "hint": "Langfuse requires endpoint: <base-url>/api/public/otel/v1/traces",
+        "example": "http://localhost:3000/api/public/otel/v1/traces or https://cloud.langfuse.com/api/public/otel/v1/traces",
+    },
+    "phoenix": {"hint": "Phoenix requires endpoint: http://localhost:6006/v1/traces"},
+    "arize": {
+        "hint": "Arize requires endpoint: https://otlp.arize.com/v1 with proper headers"
+    },
+}
+_DEFAULT_EXPORT_HINT = {
+    "hint": "Verify endpoint URL includes the full OTLP path (e.g., /v1/traces)"
+}
+
+# Resolved instrumentor classes keyed by framework name
+_INSTRUMENTOR_CACHE: dict[str, type] = {}
+
 
 def _instrument_framework(framework: str, tracer_provider: Any) -> None:
     """Dynamically import and instrument a framework.
@@ -85,8 +117,14 @@ def _instrument_framework(framework: str, tracer_provider: Any) -> None:
     module_path, class_name = app_settings.observability.instrumentor_map[framework]
 
     try:
-        module = importlib.import_module(module_path)
-        instrumentor_class = getattr(module, class_name)
+        instrumentor_class = _INSTRUMENTOR_CACHE.get(framework)
+        if instrumentor_class is None:
+            module = sys.modules.get(module_path) or importlib.import_module(
+                module_path
+            )
+            instrumentor_class = getattr(module, class_name)
+            _INSTRUMENTOR_CACHE[framework] = instrumentor_class
+
         instrumentor_class().instrument(tracer_provider=tracer_provider)
         logger.info(f"Successfully instrumented {framework} using {class_name}")
     except (ImportError, AttributeError) as e:
@@ -98,85 +136,159 @@ def _instrument_framework(framework: str, tracer_provider: Any) -> None:
         )
 
 
-def _check_missing_packages(
-    framework_spec: AgentFrameworkSpec, installed_dists: dict[str, Any]
-) -> list[str]:
+def _run_framework_instrumentation(
+    framework: str, tracer_provider: Any, verbose_logging: bool
+) -> None:
+    """Instrument ``framework``, logging rather than raising on failure.
+
+    Runs on a background thread started by :func:`setup`.
+
+    Args:
+        framework: Name of the framework to instrument
+        tracer_provider: OpenTelemetry tracer provider instance
+        verbose_logging: Enable verbose telemetry logging
+    """
+    try:
+        _instrument_framework(framework, tracer_provider)
+        if verbose_logging:
+            logger.info(
+                "OpenInference framework instrumentation completed successfully",
+                framework=framework,
+            )
+    except ImportError as e:
+        logger.error(
+            "OpenInference framework instrumentation failed - instrumentation packages unavailable",
+            framework=framework,
+            error=str(e),
+        )
+
+
+def _installed_version(dist_name: str) -> str | None:
+    """Look up the installed version of a single distribution.
+
+    Args:
+        dist_name: Distribution name
+
+    Returns:
+        Installed version, or None if the distribution is not installed
+    """
+    try:
+        return dist_version(dist_name)
+    except PackageNotFoundError:
+        return None
+
+
+def _check_missing_packages(framework_spec: AgentFrameworkSpec) -> list[str]:
     """Check for missing OpenTelemetry packages.
 
     Args:
         framework_spec: Framework specification
-        installed_dists: Dictionary of installed package distributions
 
     Returns:
         List of missing package names
     """
-    required_packages = app_settings.observability.base_packages + [
-        framework_spec.instrumentation_package
-    ]
-    return [pkg for pkg in required_packages if pkg not in installed_dists]
+    required_packages = (
+        *app_settings.observability.base_packages,
+        framework_spec.instrumentation_package,
+    )
+    return [pkg for pkg in required_packages if _installed_version(pkg) is None]
+
+
+def _resolve_export_hint(endpoint: str) -> dict[str, str]:
+    """Pick the troubleshooting hint logged when exports to ``endpoint`` fail.
+
+    Args:
+        endpoint: OTLP endpoint URL
+
+    Returns:
+        Extra fields (``hint`` and optionally ``example``) for the error log
+    """
+    tags = {tag.lower() for tag in _ENDPOINT_TAG_RE.findall(endpoint)}
+    if ":6006" in tags:
+        tags.add("phoenix")
+
+    for tag in ("langfuse", "phoenix", "arize"):
+        if tag in tags:
+            return _EXPORT_HINTS[tag]
+    return _DEFAULT_EXPORT_HINT
+
+
+@functools.lru_cache(maxsize=1)
+def _install_command_prefix() -> tuple[str, ...]:
+    """Detect the package manager used in the working directory.
+
+    Reads the directory once (instead of stat-ing each marker file) and caches
+    the result for the process lifetime.
+
+    Returns:
+        Command prefix for installing packages (``uv add`` or ``pip install``)
+    """
+    with os.scandir(".") as entries:
+        names = {entry.name for entry in entries}
+
+    if "uv.lock" in names or "pyproject.toml" in names:
+        return ("uv", "add")
+    return (sys.executable, "-m", "pip", "install")
 
 
 class _LoggingSpanExporter:
     """Wrapper exporter that logs when spans are exported."""
 
-    def __init__(self, exporter: Any, endpoint: str, verbose: bool = False):
+    __slots__ = (
+        "_success",
+        "_exporter",
+        "_endpoint",
+        "_hint",
+        "_span_count",
+        "_error_logged",
+        "_lock",
+    )
+
+    def __init__(self, exporter: Any, endpoint: str):
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        self._success = SpanExportResult.SUCCESS
         self._exporter = exporter
         self._endpoint = endpoint
+        self._hint = _resolve_export_hint(endpoint)
         self._span_count = 0
-        self._verbose = verbose
         self._error_logged = False
+        # export may run on several threads at once (fan-out, concurrent export)
+        self._lock = threading.Lock()
 
     def export(self, spans: Any) -> Any:
         """Export spans and log the operation."""
-        from opentelemetry.sdk.trace.export import SpanExportResult
-
         result = self._exporter.export(spans)
-        self._span_count += len(spans)
-
-        if self._verbose:
-            if result == SpanExportResult.SUCCESS:
-                logger.info(
-                    f"Successfully exported {len(spans)} span(s) to OTLP endpoint",
-                    endpoint=self._endpoint,
-                    total_exported=self._span_count,
-                )
+        span_count = len(spans)
+
+        with self._lock:
+            self._span_count += span_count
+            total_exported = self._span_count
+            if result is self._success:
+                log_error = False
                 self._error_logged = False
             else:
-                if not self._error_logged:
-                    self._log_export_error(result)
-                    self._error_logged = True
+                log_error = not self._error_logged
+                self._error_logged = True
+
+        if result is self._success:
+            logger.info(
+                f"Successfully exported {span_count} span(s) to OTLP endpoint",
+                endpoint=self._endpoint,
+                total_exported=total_exported,
+            )
+        elif log_error:
+            self._log_export_error(result)
 
         return result
 
     def _log_export_error(self, result: Any) -> None:
         """Log export error with helpful guidance."""
-        error_msg = f"Failed to export spans to OTLP endpoint: {self._endpoint}"
-
-        if "langfuse" in self._endpoint.lower():
-            logger.error(
-                error_msg,
-                reason=result.name,
-                hint="Langfuse requires endpoint: <base-url>/api/public/otel/v1/traces",
-                example="http://localhost:3000/api/public/otel/v1/traces or https://cloud.langfuse.com/api/public/otel/v1/traces",
-            )
-        elif "phoenix" in self._endpoint.lower() or ":6006" in self._endpoint:
-            logger.error(
-                error_msg,
-                reason=result.name,
-                hint="Phoenix requires endpoint: http://localhost:6006/v1/traces",
-            )
-        elif "arize" in self._endpoint.lower():
-            logger.error(
-                error_msg,
-                reason=result.name,
-                hint="Arize requires endpoint: https://otlp.arize.com/v1 with proper headers",
-            )
-        else:
-            logger.error(
-                error_msg,
-                reason=result.name,
-                hint="Verify endpoint URL includes the full OTLP path (e.g., /v1/traces)",
-            )
+        logger.error(
+            f"Failed to export spans to OTLP endpoint: {self._endpoint}",
+            reason=result.name,
+            **self._hint,
+        )
 
     def shutdown(self) -> Any:
         """Shutdown the underlying exporter."""
@@ -187,6 +299,233 @@ class _LoggingSpanExporter:
         return self._exporter.force_flush(timeout_millis)
 
 
+def _make_logging_exporter(exporter: Any, endpoint: str, verbose: bool) -> Any:
+    """Wrap ``exporter`` for export logging only when verbose logging is on.
+
+    Without verbose logging the wrapper has nothing to do, so the exporter is
+    returned as-is and batches skip the extra Python call frame.
+
+    Args:
+        exporter: Underlying span exporter
+        endpoint: OTLP endpoint URL the exporter sends to
+        verbose: Whether verbose telemetry logging is enabled
+
+    Returns:
+        The exporter, or a logging wrapper around it
+    """
+    if not verbose:
+        return exporter
+    return _LoggingSpanExporter(exporter, endpoint)
+
+
+class _FanoutSpanExporter:
+    """Exporter that sends each batch to several exporters concurrently.
+
+    Lets a single batch processor (one queue, one worker thread) serve many
+    OTLP endpoints, with each batch exported to all of them in parallel.
+    Every endpoint has its own worker thread, and a batch waits at most
+    ``timeout_millis`` for them, so a slow or hung endpoint delays the others
+    by no more than that timeout and never takes a healthy endpoint's worker.
+    """
+
+    __slots__ = ("_exporters", "_success", "_failure", "_timeout", "_executors")
+
+    def __init__(self, exporters: list[Any], timeout_millis: int = 30000):
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        self._exporters = exporters
+        self._success = SpanExportResult.SUCCESS
+        self._failure = SpanExportResult.FAILURE
+        self._timeout = timeout_millis / 1000
+        self._executors = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="bindu-otlp-export")
+            for _ in exporters
+        ]
+
+    def export(self, spans: Any) -> Any:
+        """Export spans to every exporter, failing if any export fails or times out."""
+        # Run each export in a copy of the caller's context so the worker
+        # threads keep the processor's suppress-instrumentation flag and the
+        # exporters' own HTTP requests are not traced
+        futures = [
+            executor.submit(contextvars.copy_context().run, e.export, spans)
+            for e, executor in zip(self._exporters, self._executors)
+        ]
+        _, not_done = wait(futures, timeout=self._timeout)
+        if not_done:
+            # The late exports keep running on their own workers; only this
+            # batch's result stops waiting for them
+            return self._failure
+        results = [future.result() for future in futures]
+        if all(result is self._success for result in results):
+            return self._success
+        return self._failure
+
+    def shutdown(self) -> None:
+        """Wait for in-flight exports, then shut down every exporter."""
+        for executor in self._executors:
+            executor.shutdown(wait=True)
+        for exporter in self._exporters:
+            exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Force flush all exporters."""
+        return all(e.force_flush(timeout_millis) for e in self._exporters)
+
+
+class _ConcurrentSpanExporter:
+    """Exporter that lets the batch processor keep several exports in flight.
+
+    ``BatchSpanProcessor`` exports one batch at a time on its worker thread,
+    so a slow endpoint backs up the queue. This wrapper hands each batch to a
+    small worker pool and returns straight away, blocking only once
+    ``max_concurrency`` exports are already running. Because ``export``
+    returns before the batch is sent, failures are logged when the export
+    completes, once per outage like ``_LoggingSpanExporter``. Pair it with the
+    processor from
+    ``_concurrent_batch_processor_cls`` so ``force_flush`` waits for
+    in-flight exports.
+    """
+
+    __slots__ = (
+        "_exporter",
+        "_success",
+        "_slots",
+        "_pending",
+        "_idle",
+        "_error_logged",
+        "_executor",
+    )
+
+    def __init__(self, exporter: Any, max_concurrency: int):
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        self._exporter = exporter
+        self._success = SpanExportResult.SUCCESS
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._pending: set[Future] = set()
+        # Notified whenever the last in-flight export has been fully handled
+        self._idle = threading.Condition()
+        self._error_logged = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="bindu-otlp-batch"
+        )
+
+    def export(self, spans: Any) -> Any:
+        """Queue spans for export, waiting only while all export slots are busy.
+
+        Returns SUCCESS once the batch is queued; the real outcome is only
+        known later and is reported by ``_export_done``.
+        """
+        self._slots.acquire()
+        # Run the export in a copy of the caller's context so the worker keeps
+        # the processor's suppress-instrumentation flag
+        future = self._executor.submit(
+            contextvars.copy_context().run, self._exporter.export, spans
+        )
+        with self._idle:
+            self._pending.add(future)
+        future.add_done_callback(self._export_done)
+        return self._success
+
+    def _export_done(self, future: Future) -> None:
+        """Log the first failure of an outage, then release the export slot."""
+        error = future.exception()
+        result = future.result() if error is None else None
+        with self._idle:
+            if result is self._success:
+                self._error_logged = False
+            elif not self._error_logged:
+                # Stay quiet for the rest of the outage, until an export succeeds
+                self._error_logged = True
+                if error is not None:
+                    logger.error("Exception while exporting spans", error=str(error))
+                else:
+                    logger.error(
+                        "Failed to export spans",
+                        reason=getattr(result, "name", str(result)),
+                    )
+            self._pending.discard(future)
+            if not self._pending:
+                self._idle.notify_all()
+        self._slots.release()
+
+    def wait_pending(self, timeout_millis: int) -> bool:
+        """Wait for in-flight exports to be handled, returning False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(
+                lambda: not self._pending, timeout=timeout_millis / 1000
+            )
+
+    def shutdown(self) -> None:
+        """Finish in-flight exports, then shut down the underlying exporter."""
+        self._executor.shutdown(wait=True)
+        self._exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Wait for in-flight exports, then force flush the underlying exporter."""
+        if not self.wait_pending(timeout_millis):
+            return False
+        return self._exporter.force_flush(timeout_millis)
+
+
+@functools.cache
+def _concurrent_batch_processor_cls() -> type:
+    """Return a ``BatchSpanProcessor`` that also flushes a concurrent exporter.
+
+    ``BatchProcessor.force_flush`` exports whatever is queued but never calls
+    the exporter's ``force_flush``, so batches handed to a
+    ``_ConcurrentSpanExporter`` could still be in flight when a flush
+    returns. The subclass is built on first use so the SDK is only imported
+    when OTLP export is configured.
+
+    Returns:
+        BatchSpanProcessor subclass for use with ``_ConcurrentSpanExporter``
+    """
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    class _ConcurrentBatchSpanProcessor(BatchSpanProcessor):
+        """Batch processor whose flush waits for pipelined exports."""
+
+        def force_flush(self, timeout_millis: int | None = None) -> bool:
+            """Export queued spans, then wait for exports still in flight."""
+            if not super().force_flush(timeout_millis):
+                return False
+            return self.span_exporter.force_flush(timeout_millis or 30000)
+
+    return _ConcurrentBatchSpanProcessor
+
+
+@dataclass(frozen=True, slots=True)
+class _ResourceKey:
+    """Service metadata identifying a tracer resource."""
+
+    service_name: str
+    service_version: str
+    deployment_environment: str
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_resource(key: _ResourceKey) -> Any:
+    """Build the OpenTelemetry resource for a service, reusing earlier results.
+
+    Args:
+        key: Service name, version and deployment environment
+
+    Returns:
+        Resource carrying the service metadata
+    """
+    from opentelemetry.sdk.resources import SERVICE_NAME, SERVICE_VERSION, Resource
+
+    return Resource.create(
+        {
+            SERVICE_NAME: key.service_name,
+            SERVICE_VERSION: key.service_version,
+            "deployment.environment": key.deployment_environment,
+        }
+    )
+
+
 def _setup_tracer_provider(
     oltp_endpoint: str | list[str] | None = None,
     oltp_service_name: str | None = None,
@@ -198,6 +537,7 @@ def _setup_tracer_provider(
     batch_schedule_delay_millis: int = 5000,
     batch_max_export_batch_size: int = 512,
     batch_export_timeout_millis: int = 30000,
+    max_export_concurrency: int = 2,
 ) -> Any:
     """Set up and configure OpenTelemetry tracer provider.
 
@@ -212,65 +552,82 @@ def _setup_tracer_provider(
         batch_schedule_delay_millis: Schedule delay for batch processor
         batch_max_export_batch_size: Max export batch size
         batch_export_timeout_millis: Export timeout in milliseconds
+        max_export_concurrency: Max batches exported in parallel (1 exports
+            one batch at a time)
 
     Returns:
         Configured TracerProvider instance
     """
     from opentelemetry import trace
-    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
     from opentelemetry.sdk import trace as trace_sdk
-    from opentelemetry.sdk.resources import SERVICE_NAME, SERVICE_VERSION, Resource
-    from opentelemetry.sdk.trace.export import (
-        BatchSpanProcessor,
-        ConsoleSpanExporter,
-        SimpleSpanProcessor,
-    )
 
     # Create resource with service metadata for better trace organization
-    resource_attrs = {
-        SERVICE_NAME: oltp_service_name or "bindu-agent",
-        SERVICE_VERSION: service_version,
-        "deployment.environment": deployment_environment,
-    }
-
-    resource = Resource.create(resource_attrs)
+    service_name = oltp_service_name or "bindu-agent"
+    resource = _cached_resource(
+        _ResourceKey(service_name, service_version, deployment_environment)
+    )
     tracer_provider = trace_sdk.TracerProvider(resource=resource)
 
     # Use provided endpoint(s) or fall back to console
     if oltp_endpoint:
+        # Only pull in the OTLP/HTTP exporter stack when it is actually used
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
         # Normalize to list for uniform handling
         endpoints = [oltp_endpoint] if isinstance(oltp_endpoint, str) else oltp_endpoint
 
-        # Batch processor configuration
-        batch_config = {
-            "max_queue_size": batch_max_queue_size,
-            "schedule_delay_millis": batch_schedule_delay_millis,
-            "max_export_batch_size": batch_max_export_batch_size,
-            "export_timeout_millis": batch_export_timeout_millis,
-        }
-
-        # Create a processor for each endpoint
-        for endpoint in endpoints:
-            # Create OTLP exporter with logging wrapper
-            otlp_exporter = OTLPSpanExporter(endpoint=endpoint, headers=oltp_headers)
-            logging_exporter = _LoggingSpanExporter(
-                otlp_exporter, endpoint, verbose_logging
+        # Create an OTLP exporter with logging wrapper for each endpoint
+        exporters = [
+            _make_logging_exporter(
+                OTLPSpanExporter(endpoint=endpoint, headers=oltp_headers),
+                endpoint,
+                verbose_logging,
             )
+            for endpoint in endpoints
+        ]
+
+        # One batch processor feeds all endpoints; several are exported in parallel
+        exporter = (
+            exporters[0]
+            if len(exporters) == 1
+            else _FanoutSpanExporter(exporters, batch_export_timeout_millis)
+        )
+
+        # Pipeline batches so one slow export doesn't stall the queue
+        processor_cls: type = BatchSpanProcessor
+        if max_export_concurrency > 1:
+            exporter = _ConcurrentSpanExporter(exporter, max_export_concurrency)
+            processor_cls = _concurrent_batch_processor_cls()
+
+        # Type ignore: exporter wrappers implement SpanExporter protocol
+        processor = processor_cls(
+            exporter,  # type: ignore[arg-type]
+            max_queue_size=batch_max_queue_size,
+            schedule_delay_millis=batch_schedule_delay_millis,
+            max_export_batch_size=batch_max_export_batch_size,
+            export_timeout_millis=batch_export_timeout_millis,
+        )
+        tracer_provider.add_span_processor(processor)
 
-            # Type ignore: _LoggingSpanExporter implements SpanExporter protocol
-            processor = BatchSpanProcessor(logging_exporter, **batch_config)  # type: ignore[arg-type]
-            tracer_provider.add_span_processor(processor)
-
-            if verbose_logging:
-                logger.info(
-                    "Configured OTLP exporter with batch processing",
-                    endpoint=endpoint,
-                    max_queue_size=batch_max_queue_size,
-                    schedule_delay_millis=batch_schedule_delay_millis,
-                    max_export_batch_size=batch_max_export_batch_size,
-                    export_timeout_millis=batch_export_timeout_millis,
-                )
+        if verbose_logging:
+            logger.info(
+                "Configured OTLP exporters with batch processing",
+                endpoints=list(endpoints),
+                max_queue_size=batch_max_queue_size,
+                schedule_delay_millis=batch_schedule_delay_millis,
+                max_export_batch_size=batch_max_export_batch_size,
+                export_timeout_millis=batch_export_timeout_millis,
+                max_export_concurrency=max_export_concurrency,
+            )
     else:
+        from opentelemetry.sdk.trace.export import (
+            ConsoleSpanExporter,
+            SimpleSpanProcessor,
+        )
+
         tracer_provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
         if verbose_logging:
             logger.info("Using console exporter - no OTLP endpoint configured")
@@ -280,8 +637,8 @@ def _setup_tracer_provider(
     if verbose_logging:
         logger.info(
             "Global tracer provider configured",
-            service_name=resource_attrs[SERVICE_NAME],
-            environment=resource_attrs["deployment.environment"],
+            service_name=service_name,
+            environment=deployment_environment,
         )
 
     return tracer_provider
@@ -298,12 +655,13 @@ def setup(
     batch_schedule_delay_millis: int = 5000,
     batch_max_export_batch_size: int = 512,
     batch_export_timeout_millis: int = 30000,
+    max_export_concurrency: int = 2,
 ) -> None:
     """Set up OpenInference instrumentation for AI observability.
 
     This function:
     1. Sets up OpenTelemetry tracer provider (always)
-    2. Optionally instruments AI frameworks if available
+    2. Optionally instruments AI frameworks if available (on a background thread)
 
     Args:
         oltp_endpoint: OTLP endpoint URL(s) for sending traces. Can be:
@@ -318,6 +676,8 @@ def setup(
         batch_schedule_delay_millis: Schedule delay for batch processor
         batch_max_export_batch_size: Max export batch size
         batch_export_timeout_millis: Export timeout in milliseconds
+        max_export_concurrency: Max batches exported in parallel (1 exports
+            one batch at a time)
     """
     # ALWAYS setup tracer provider first (for Bindu framework tracing)
     tracer_provider = _setup_tracer_provider(
@@ -331,14 +691,28 @@ def setup(
         batch_schedule_delay_millis=batch_schedule_delay_millis,
         batch_max_export_batch_size=batch_max_export_batch_size,
         batch_export_timeout_millis=batch_export_timeout_millis,
+        max_export_concurrency=max_export_concurrency,
     )
 
+    observability_settings = app_settings.observability
+    if (
+        not observability_settings.framework_autodetect
+        or not observability_settings.instrumentor_map
+    ):
+        if verbose_logging:
+            logger.info("OpenInference framework instrumentation disabled by settings")
+        return
+
     # Step 1: Detect installed framework for optional instrumentation (logic from _detect_framework, now inlined)
-    installed_dists = {dist.name: dist for dist in distributions()}
-    framework_spec = next(
-        (spec for spec in SUPPORTED_FRAMEWORKS if spec.framework in installed_dists),
-        None,
-    )
+    # Targeted lookups in priority order stop at the first installed framework,
+    # instead of enumerating every installed distribution up front
+    framework_spec = None
+    installed_version = None
+    for spec in SUPPORTED_FRAMEWORKS:
+        installed_version = _installed_version(spec.framework)
+        if installed_version is not None:
+            framework_spec = spec
+            break
 
     if not framework_spec:
         if verbose_logging:
@@ -349,9 +723,7 @@ def setup(
         return
 
     # Step 2: Validate framework version (logic from _validate_framework_version, now inlined)
-    installed_version = installed_dists[framework_spec.framework].version
-
-    if version.parse(installed_version) < version.parse(framework_spec.min_version):
+    if version.parse(installed_version) < _MIN_VERSIONS[framework_spec.framework]:
         if verbose_logging:
             logger.warning(
                 "OpenInference framework instrumentation skipped - framework version below minimum",
@@ -370,18 +742,10 @@ def setup(
         )
 
     # Step 3: Check for missing packages
-    missing_packages = _check_missing_packages(framework_spec, installed_dists)
+    missing_packages = _check_missing_packages(framework_spec)
 
     if missing_packages:
-        # Detect package manager (logic from _get_package_manager, now inlined)
-        current_directory = Path.cwd()
-        has_uv = (current_directory / "uv.lock").exists() or (
-            current_directory / "pyproject.toml"
-        ).exists()
-        cmd_prefix = (
-            ["uv", "add"] if has_uv else [sys.executable, "-m", "pip", "install"]
-        )
-        install_cmd = " ".join(cmd_prefix + missing_packages)
+        install_cmd = " ".join((*_install_command_prefix(), *missing_packages))
 
         logger.warning(
             "Missing OpenInference packages - auto-installation disabled for safety",
@@ -404,16 +768,12 @@ def setup(
             framework=framework_spec.framework,
         )
 
-    try:
-        _instrument_framework(framework_spec.framework, tracer_provider)
-        if verbose_logging:
-            logger.info(
-                "OpenInference framework instrumentation completed successfully",
-                framework=framework_spec.framework,
-            )
-    except ImportError as e:
-        logger.error(
-            "OpenInference framework instrumentation failed - instrumentation packages unavailable",
-            framework=framework_spec.framework,
-            error=str(e),
-        )
+    # Importing the instrumentor and patching the framework can take hundreds of
+    # milliseconds; the tracer provider is already global, so let it finish in
+    # the background instead of blocking setup()
+    threading.Thread(
+        target=_run_framework_instrumentation,
+        args=(framework_spec.framework, tracer_provider, verbose_logging),
+        daemon=True,
+        name="bindu-instrument",
+    ).start()
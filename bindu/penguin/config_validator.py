@@ -5,46 +5,83 @@ This module provides utilities to validate and process agent configurations,
 ensuring they meet the required schema and have proper defaults.
 """
 
+import mmap
 import os
+import re
+from types import MappingProxyType
 from typing import Any, Dict
 
+import orjson
+
 from bindu import __version__
 from bindu.common.protocol.types import AgentCapabilities, Skill
 
+# Config files at least this large (e.g. big skill catalogs or extra_metadata)
+# are parsed via mmap
+_MMAP_THRESHOLD = 1 << 20
+
+
+_HTTP_URL_RE = re.compile(r"^https?://")
+
+
+def _is_http_url(value: Any) -> bool:
+    """Check that a value is an http(s) URL string."""
+    return isinstance(value, str) and _HTTP_URL_RE.match(value) is not None
+
+
+def _env_to_bool(value: str) -> bool:
+    """Interpret an environment variable value as a boolean."""
+    return value.strip().lower() in ("true", "1", "yes")
+
+
+# Opt-in: hand configs produced by validate_and_process back without
+# re-validating them (only safe if callers don't mutate validated configs)
+_TRUST_VALIDATED = _env_to_bool(os.getenv("BINDU_TRUST_VALIDATED", ""))
+
+
+class _ValidatedConfig(dict):
+    """Processed config returned by validate_and_process."""
+
+    # No per-instance __dict__; the marker type is all this subclass adds
+    __slots__ = ()
+
 
 class ConfigValidator:
     """Validates and processes agent configuration."""
 
-    DEFAULTS = {
-        "name": "bindu-agent",
-        "description": "A Bindu agent",
-        "version": __version__,
-        "recreate_keys": False,
-        "skills": [],
-        "capabilities": {},
-        "storage": {"type": "memory"},
-        "scheduler": {"type": "memory"},
-        "kind": "agent",
-        "debug_mode": False,
-        "debug_level": 1,
-        "monitoring": False,
-        "telemetry": True,
-        "num_history_sessions": 10,
-        "documentation_url": None,
-        "extra_metadata": {},
-        "agent_trust": None,
-        "key_password": None,
-        "auth": None,
-        "oltp_endpoint": None,
-        "oltp_service_name": None,
-        "oltp_verbose_logging": False,
-        "oltp_service_version": "1.0.0",
-        "oltp_deployment_environment": "production",
-        "oltp_batch_max_queue_size": 2048,
-        "oltp_batch_schedule_delay_millis": 5000,
-        "oltp_batch_max_export_batch_size": 512,
-        "oltp_batch_export_timeout_millis": 30000,
-    }
+    # Read-only view so the class-level defaults are never modified in place
+    DEFAULTS = MappingProxyType(
+        {
+            "name": "bindu-agent",
+            "description": "A Bindu agent",
+            "version": __version__,
+            "recreate_keys": False,
+            "skills": [],
+            "capabilities": {},
+            "storage": {"type": "memory"},
+            "scheduler": {"type": "memory"},
+            "kind": "agent",
+            "debug_mode": False,
+            "debug_level": 1,
+            "monitoring": False,
+            "telemetry": True,
+            "num_history_sessions": 10,
+            "documentation_url": None,
+            "extra_metadata": {},
+            "agent_trust": None,
+            "key_password": None,
+            "auth": None,
+            "oltp_endpoint": None,
+            "oltp_service_name": None,
+            "oltp_verbose_logging": False,
+            "oltp_service_version": "1.0.0",
+            "oltp_deployment_environment": "production",
+            "oltp_batch_max_queue_size": 2048,
+            "oltp_batch_schedule_delay_millis": 5000,
+            "oltp_batch_max_export_batch_size": 512,
+            "oltp_batch_export_timeout_millis": 30000,
+        }
+    )
 
     # Required fields (supports nested keys via dot notation)
     REQUIRED_FIELDS = [
@@ -53,17 +90,65 @@ class ConfigValidator:
         "deployment.url",
     ]
 
+    # Hydra auth fields: (name, check, error message formatted with the value)
+    _HYDRA_SPEC = (
+        (
+            "admin_url",
+            _is_http_url,
+            "Invalid Hydra admin_url: '{}'. "
+            "Expected format: 'https://hydra-admin.getbindu.com'",
+        ),
+    )
+
+    # Telemetry fields that accept "env:VAR_NAME", with how to convert the value
+    _OLTP_ENV_FIELDS = (
+        ("oltp_endpoint", str),
+        ("oltp_service_name", str),
+        ("oltp_verbose_logging", _env_to_bool),
+    )
+
+    # Scalar field types as (name, accepted types, error message), checked in
+    # one pass; value ranges and execution_cost are checked after the loop
+    _TYPE_SPEC: tuple[tuple[str, type | tuple[type, ...], str], ...] = (
+        *(
+            (field, (str, type(None)), f"Field '{field}' must be a string")
+            for field in (
+                "author",
+                "name",
+                "description",
+                "version",
+                "kind",
+                "key_password",
+            )
+        ),
+        *(
+            (field, bool, f"Field '{field}' must be a boolean")
+            for field in ("recreate_keys", "debug_mode", "monitoring", "telemetry")
+        ),
+        ("debug_level", int, "Field 'debug_level' must be 1 or 2"),
+        (
+            "num_history_sessions",
+            int,
+            "Field 'num_history_sessions' must be a non-negative integer",
+        ),
+    )
+
+    # Required fields with their key paths split once, in declaration order
+    _REQUIRED_FIELD_PATHS = tuple(
+        (field, tuple(field.split("."))) for field in REQUIRED_FIELDS
+    )
+
     @classmethod
     def validate_and_process(cls, config: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and process agent configuration."""
+        if _TRUST_VALIDATED and type(config) is _ValidatedConfig:
+            return config
+
         # 🔥 Validate required fields first (fail-fast)
         cls._validate_required_fields(config)
 
-        # Start with defaults
-        processed_config = cls.DEFAULTS.copy()
-
-        # Update with provided config
-        processed_config.update(config)
+        # Start with defaults, overridden by the provided config
+        processed_config = {**cls.DEFAULTS, **config}
 
         # Process complex fields
         processed_config = cls._process_complex_fields(processed_config)
@@ -71,7 +156,7 @@ class ConfigValidator:
         # Validate field types
         cls._validate_field_types(processed_config)
 
-        return processed_config
+        return _ValidatedConfig(processed_config)
 
     # ------------------------------------------------------------------
     # Required field validation (NEW IMPROVED VERSION)
@@ -82,19 +167,16 @@ class ConfigValidator:
         """Validate required fields including nested fields."""
         missing = []
 
-        for field in cls.REQUIRED_FIELDS:
-            keys = field.split(".")
+        for field, keys in cls._REQUIRED_FIELD_PATHS:
             value = config
 
             for key in keys:
                 if not isinstance(value, dict) or key not in value:
-                    missing.append(field)
+                    value = None
                     break
                 value = value[key]
 
-            if field not in missing and (
-                value is None or (isinstance(value, str) and not value.strip())
-            ):
+            if value is None or (isinstance(value, str) and not value.strip()):
                 missing.append(field)
 
         if missing:
@@ -121,10 +203,12 @@ class ConfigValidator:
     def _process_complex_fields(cls, config: Dict[str, Any]) -> Dict[str, Any]:
         if isinstance(config.get("skills"), list) and config["skills"]:
             if isinstance(config["skills"][0], dict):
-                config["skills"] = [Skill(**skill) for skill in config["skills"]]
+                # Skill and AgentCapabilities are TypedDicts, i.e. plain dict
+                # copies; copying from the mapping skips the ** kwargs round trip
+                config["skills"] = [Skill(skill) for skill in config["skills"]]
 
         if isinstance(config.get("capabilities"), dict):
-            config["capabilities"] = AgentCapabilities(**config["capabilities"])
+            config["capabilities"] = AgentCapabilities(config["capabilities"])
 
         if config.get("auth"):
             cls._validate_auth_config(config["auth"])
@@ -140,44 +224,19 @@ class ConfigValidator:
 
     @classmethod
     def _validate_field_types(cls, config: Dict[str, Any]) -> None:
-        string_fields = [
-            "author",
-            "name",
-            "description",
-            "version",
-            "kind",
-            "key_password",
-        ]
-
-        for field in string_fields:
-            if (
-                field in config
-                and config[field] is not None
-                and not isinstance(config[field], str)
-            ):
-                raise ValueError(f"Field '{field}' must be a string")
-
-        bool_fields = ["recreate_keys", "debug_mode", "monitoring", "telemetry"]
-        for field in bool_fields:
-            if field in config and not isinstance(config[field], bool):
-                raise ValueError(f"Field '{field}' must be a boolean")
-
-        if "debug_level" in config:
-            if not isinstance(config["debug_level"], int) or config[
-                "debug_level"
-            ] not in [1, 2]:
-                raise ValueError("Field 'debug_level' must be 1 or 2")
-
-        if "num_history_sessions" in config:
-            if (
-                not isinstance(config["num_history_sessions"], int)
-                or config["num_history_sessions"] < 0
-            ):
-                raise ValueError(
-                    "Field 'num_history_sessions' must be a non-negative integer"
-                )
-
-        if config.get("kind") not in ["agent", "team", "workflow"]:
+        for field, types, error in cls._TYPE_SPEC:
+            if field in config and not isinstance(config[field], types):
+                raise ValueError(error)
+
+        if "debug_level" in config and config["debug_level"] not in (1, 2):
+            raise ValueError("Field 'debug_level' must be 1 or 2")
+
+        if "num_history_sessions" in config and config["num_history_sessions"] < 0:
+            raise ValueError(
+                "Field 'num_history_sessions' must be a non-negative integer"
+            )
+
+        if config.get("kind") not in ("agent", "team", "workflow"):
             raise ValueError("Field 'kind' must be one of: agent, team, workflow")
 
         # execution_cost can be either a single dict or a list of dicts
@@ -228,13 +287,9 @@ class ConfigValidator:
 
     @classmethod
     def _validate_hydra_config(cls, auth_config: Dict[str, Any]) -> None:
-        if "admin_url" in auth_config:
-            admin_url = auth_config["admin_url"]
-            if not admin_url.startswith(("http://", "https://")):
-                raise ValueError(
-                    f"Invalid Hydra admin_url: '{admin_url}'. "
-                    f"Expected format: 'https://hydra-admin.getbindu.com'"
-                )
+        for field, check, error in cls._HYDRA_SPEC:
+            if field in auth_config and not check(auth_config[field]):
+                raise ValueError(error.format(auth_config[field]))
 
     # ------------------------------------------------------------------
     # Telemetry processing
@@ -242,10 +297,13 @@ class ConfigValidator:
 
     @classmethod
     def _process_oltp_config(cls, config: Dict[str, Any]) -> None:
-        oltp_endpoint = config.get("oltp_endpoint")
-        if oltp_endpoint and isinstance(oltp_endpoint, str):
-            if oltp_endpoint.startswith("env:"):
-                config["oltp_endpoint"] = os.getenv(oltp_endpoint[4:])
+        # Resolve "env:VAR_NAME" references against the environment
+        env = os.environ
+        for field, coerce in cls._OLTP_ENV_FIELDS:
+            value = config.get(field)
+            if isinstance(value, str) and value.startswith("env:"):
+                raw = env.get(value[4:])
+                config[field] = coerce(raw) if raw is not None else None
 
     # ------------------------------------------------------------------
     # Public helper
@@ -258,14 +316,22 @@ class ConfigValidator:
 
 
 def load_and_validate_config(config_path: str) -> Dict[str, Any]:
-    """Load and validate configuration from file path."""
-    import json
+    """Load and validate configuration from file path.
 
+    The file is parsed with orjson on every call, so edits and "env:VAR"
+    references are always picked up. Large files are parsed from a read-only
+    memory map to avoid copying them into a bytes object.
+    """
     if not os.path.isabs(config_path):
         caller_dir = os.path.dirname(os.path.abspath(__file__))
         config_path = os.path.join(caller_dir, config_path)
 
-    with open(config_path, "r") as f:
-        raw_config = json.load(f)
+    with open(config_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            # Parse straight from the page cache instead of copying into bytes
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                raw_config = orjson.loads(memoryview(mm))
+        else:
+            raw_config = orjson.loads(f.read())
 
     return ConfigValidator.create_bindufy_config(raw_config)
@@ -5,8 +5,10 @@ It belongs in penguin (not utils) because it's domain-specific to agent setup.
 """
 
 import asyncio
+import os
 from pathlib import Path
-from typing import Optional
+from types import ModuleType
+from typing import Any, Optional
 from uuid import UUID
 
 from bindu.extensions.did import DIDAgentExtension
@@ -15,6 +17,19 @@ from bindu.utils.logging import get_logger
 
 logger = get_logger("bindu.penguin.did_setup")
 
+# Vault client module, imported on first use so agents without Vault skip it
+_vault_client_module: Optional[ModuleType] = None
+
+
+def _get_vault_client_module() -> ModuleType:
+    """Import ``bindu.utils.vault_client`` once and return the cached module."""
+    global _vault_client_module
+    if _vault_client_module is None:
+        from bindu.utils import vault_client
+
+        _vault_client_module = vault_client
+    return _vault_client_module
+
 
 def initialize_did_extension(
     agent_id: str | UUID,
@@ -44,24 +59,108 @@ def initialize_did_extension(
         logger.info(f"Initializing DID extension for agent: {agent_name}")
 
         pki_dir = key_dir / app_settings.did.pki_dir
+        extension_kwargs = {
+            "recreate_keys": recreate_keys,
+            "key_dir": pki_dir,
+            "author": author,
+            "agent_name": agent_name,
+            "agent_id": str(agent_id),
+            "key_password": key_password,
+        }
+
+        if app_settings.vault.enabled:
+            # One event loop and Vault session for both restore and backup
+            did_extension = asyncio.run(
+                _initialize_with_vault(str(agent_id), pki_dir, extension_kwargs)
+            )
+        else:
+            did_extension = _create_did_extension(extension_kwargs)
+
+        logger.info(f"DID extension initialized successfully: {did_extension.did}")
+        return did_extension
+
+    except Exception as exc:
+        logger.error(f"Failed to initialize DID extension: {exc}")
+        raise
+
 
-        # Try to restore DID keys from Vault if enabled and keys don't exist locally
-        if app_settings.vault.enabled and not recreate_keys:
-            from bindu.utils.vault_client import restore_did_keys_from_vault
+def _local_keys_exist(pki_dir: Path) -> bool:
+    """Check whether both DID key files exist, using a single directory scan.
+
+    Args:
+        pki_dir: Directory holding the DID keys
+
+    Returns:
+        True if both the private and public key files are present
+    """
+    key_files = {
+        app_settings.did.private_key_filename,
+        app_settings.did.public_key_filename,
+    }
+    try:
+        with os.scandir(pki_dir) as entries:
+            found = {entry.name for entry in entries if entry.name in key_files}
+    except FileNotFoundError:
+        return False
+    return found == key_files
+
+
+def _create_did_extension(extension_kwargs: dict[str, Any]) -> DIDAgentExtension:
+    """Create the DID extension, ensure its key pair exists and check integrity.
+
+    Args:
+        extension_kwargs: Keyword arguments for DIDAgentExtension
+
+    Returns:
+        DIDAgentExtension instance with keys available
+
+    Raises:
+        ValueError: If the DID integrity check fails
+    """
+    did_extension = DIDAgentExtension(**extension_kwargs)
 
-            # Check if keys already exist locally
-            private_key_exists = (pki_dir / "private_key.pem").exists()
-            public_key_exists = (pki_dir / "public_key.pem").exists()
+    # Generate and save key pair (will skip if keys already exist and recreate_keys=False)
+    did_extension.generate_and_save_key_pair()
 
-            if not (private_key_exists and public_key_exists):
+    # Perform integrity checks after keys are available
+    try:
+        did_extension.check_integrity()
+        logger.info("✅ DID configuration and keys pass integrity check")
+    except ValueError as e:
+        logger.error(f"❌ DID integrity check failed: {e}")
+        # We might want to raise here to stop startup, or just log
+        # For now, let's raise to enforce security
+        raise
+
+    return did_extension
+
+
+async def _initialize_with_vault(
+    agent_id: str, pki_dir: Path, extension_kwargs: dict[str, Any]
+) -> DIDAgentExtension:
+    """Restore keys from Vault, create the DID extension and back the keys up.
+
+    Args:
+        agent_id: Unique agent identifier
+        pki_dir: Directory holding the DID keys
+        extension_kwargs: Keyword arguments for DIDAgentExtension
+
+    Returns:
+        DIDAgentExtension instance with keys available
+    """
+    vault_client = _get_vault_client_module()
+    vault = vault_client.VaultClient()
+    try:
+        # Try to restore DID keys from Vault if keys don't exist locally
+        if not extension_kwargs["recreate_keys"]:
+            if not _local_keys_exist(pki_dir):
                 logger.info(
                     f"Attempting to restore DID keys from Vault for agent: {agent_id}"
                 )
-                restored_did = asyncio.run(
-                    restore_did_keys_from_vault(
-                        agent_id=str(agent_id),
-                        key_dir=pki_dir,
-                    )
+                restored_did = await vault_client.restore_did_keys_from_vault(
+                    agent_id=agent_id,
+                    key_dir=pki_dir,
+                    vault=vault,
                 )
 
                 if restored_did:
@@ -71,50 +170,22 @@ def initialize_did_extension(
                         "No existing DID keys found in Vault, will generate new keys"
                     )
 
-        # Create DID extension
-        did_extension = DIDAgentExtension(
-            recreate_keys=recreate_keys,
+        did_extension = _create_did_extension(extension_kwargs)
+
+        # Backup keys to Vault
+        logger.info(f"Backing up DID keys to Vault for agent: {agent_id}")
+        backup_success = await vault_client.backup_did_keys_to_vault(
+            agent_id=agent_id,
             key_dir=pki_dir,
-            author=author,
-            agent_name=agent_name,
-            agent_id=str(agent_id),
-            key_password=key_password,
+            did=did_extension.did,
+            vault=vault,
         )
 
-        # Generate and save key pair (will skip if keys already exist and recreate_keys=False)
-        did_extension.generate_and_save_key_pair()
-
-        # Perform integrity checks after keys are available
-        try:
-            did_extension.check_integrity()
-            logger.info("✅ DID configuration and keys pass integrity check")
-        except ValueError as e:
-            logger.error(f"❌ DID integrity check failed: {e}")
-            # We might want to raise here to stop startup, or just log
-            # For now, let's raise to enforce security
-            raise
-
-        # Backup keys to Vault if enabled and keys were newly generated
-        if app_settings.vault.enabled:
-            from bindu.utils.vault_client import backup_did_keys_to_vault
-
-            logger.info(f"Backing up DID keys to Vault for agent: {agent_id}")
-            backup_success = asyncio.run(
-                backup_did_keys_to_vault(
-                    agent_id=str(agent_id),
-                    key_dir=pki_dir,
-                    did=did_extension.did,
-                )
-            )
-
-            if backup_success:
-                logger.info("✅ DID keys backed up to Vault")
-            else:
-                logger.warning("⚠️  Failed to backup DID keys to Vault")
+        if backup_success:
+            logger.info("✅ DID keys backed up to Vault")
+        else:
+            logger.warning("⚠️  Failed to backup DID keys to Vault")
 
-        logger.info(f"DID extension initialized successfully: {did_extension.did}")
         return did_extension
-
-    except Exception as exc:
-        logger.error(f"Failed to initialize DID extension: {exc}")
-        raise
+    finally:
+        await vault.close()
@@ -407,6 +407,11 @@ class BinduApplication(Starlette):
             if app._payment_session_manager:
                 await app._payment_session_manager.stop_cleanup_task()
 
+                # Persist settlement failures still queued for batched writes
+                from .workers.helpers import PaymentHandler
+
+                await PaymentHandler.drain_settlement_failures()
+
             # Cleanup storage
             logger.info("🧹 Cleaning up storage...")
             from .storage.factory import close_storage
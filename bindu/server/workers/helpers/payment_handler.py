@@ -5,6 +5,8 @@ This module handles x402 payment settlement and related operations.
 
 from __future__ import annotations
 
+import asyncio
+import os
 from typing import Any
 
 from x402.facilitator import FacilitatorClient
@@ -20,6 +22,73 @@ from bindu.utils.worker_utils import MessageConverter
 
 logger = get_logger("bindu.server.workers.helpers.payment_handler")
 
+# Which validation entry point each model offers never changes at runtime,
+# so probe once at import instead of on every parsed message
+_PP_HAS_MODEL_VALIDATE = hasattr(PaymentPayload, "model_validate")
+_PR_HAS_MODEL_VALIDATE = hasattr(PaymentRequirements, "model_validate")
+
+
+# Serialized settle responses keyed by (transaction, success, error_reason),
+# least recently used evicted first. Retries and idempotent replays of a
+# settlement return the same receipt, so it only needs to be dumped once.
+_RECEIPT_CACHE: dict[tuple[Any, bool, Any], dict[str, Any]] = {}
+_RECEIPT_CACHE_SIZE = 512
+
+# Opt-in: write settlement failures in batches from a background task instead
+# of inline in the settlement path. Failures are persisted shortly after
+# _handle_settlement_failure returns rather than before.
+_BATCH_SETTLEMENT_FAILURES = os.getenv(
+    "BINDU_BATCH_SETTLEMENT_FAILURES", ""
+).lower() in ("1", "true", "yes")
+_FAILURE_FLUSH_INTERVAL = 0.05
+
+_failure_queue: asyncio.Queue | None = None
+_failure_flusher: asyncio.Task | None = None
+
+
+def _settlement_receipt(settle_response: Any) -> dict[str, Any]:
+    """Serialize a settle response into a receipt dict, reusing earlier dumps.
+
+    Only responses carrying a transaction hash are cached; the caller always
+    gets its own copy.
+
+    Args:
+        settle_response: Response returned by the facilitator's settle call
+
+    Returns:
+        Receipt dict for the payment metadata
+    """
+    transaction = getattr(settle_response, "transaction", None)
+    key = (
+        (
+            transaction,
+            settle_response.success,
+            getattr(settle_response, "error_reason", None),
+        )
+        if transaction
+        else None
+    )
+
+    if key is not None:
+        receipt = _RECEIPT_CACHE.pop(key, None)
+        if receipt is not None:
+            # Re-insert to mark as most recently used
+            _RECEIPT_CACHE[key] = receipt
+            return dict(receipt)
+
+    receipt = (
+        settle_response.model_dump(by_alias=True)
+        if hasattr(settle_response, "model_dump")
+        else dict(settle_response)
+    )
+
+    if key is not None:
+        if len(_RECEIPT_CACHE) >= _RECEIPT_CACHE_SIZE:
+            del _RECEIPT_CACHE[next(iter(_RECEIPT_CACHE))]
+        _RECEIPT_CACHE[key] = receipt
+        return dict(receipt)
+    return receipt
+
 
 class PaymentHandler:
     """Handles x402 payment settlement and parsing.
@@ -44,8 +113,17 @@ class PaymentHandler:
         """
         if data is None:
             return None
+        # Metadata is decoded JSON, so anything but a dict can never validate;
+        # reject it here rather than via a validation error and traceback
+        if not isinstance(data, dict):
+            logger.warning(
+                "Failed to parse payment payload",
+                error="expected a dict",
+                data_type=type(data).__name__,
+            )
+            return None
         try:
-            if hasattr(PaymentPayload, "model_validate"):
+            if _PP_HAS_MODEL_VALIDATE:
                 return PaymentPayload.model_validate(data)  # type: ignore
             return PaymentPayload(**data)
         except Exception as e:
@@ -54,7 +132,7 @@ class PaymentHandler:
                 error=str(e),
                 error_type=type(e).__name__,
                 data_type=type(data).__name__,
-                has_scheme=bool(isinstance(data, dict) and "scheme" in data),
+                has_scheme="scheme" in data,
             )
             return None
 
@@ -70,8 +148,17 @@ class PaymentHandler:
         """
         if data is None:
             return None
+        # Metadata is decoded JSON, so anything but a dict can never validate;
+        # reject it here rather than via a validation error and traceback
+        if not isinstance(data, dict):
+            logger.warning(
+                "Failed to parse payment requirements",
+                error="expected a dict",
+                data_type=type(data).__name__,
+            )
+            return None
         try:
-            if hasattr(PaymentRequirements, "model_validate"):
+            if _PR_HAS_MODEL_VALIDATE:
                 return PaymentRequirements.model_validate(data)  # type: ignore
             return PaymentRequirements(**data)
         except Exception as e:
@@ -80,7 +167,7 @@ class PaymentHandler:
                 error=str(e),
                 error_type=type(e).__name__,
                 data_type=type(data).__name__,
-                has_accepts=bool(isinstance(data, dict) and "accepts" in data),
+                has_accepts="accepts" in data,
             )
             return None
 
@@ -108,11 +195,13 @@ class PaymentHandler:
             return PaymentHandler.parse_payment_requirements(accepts[0])
 
         # Match by scheme and network
+        scheme = getattr(payload, "scheme", None)
+        network = getattr(payload, "network", None)
         for req in accepts:
             if (
                 isinstance(req, dict)
-                and req.get("scheme") == getattr(payload, "scheme", None)
-                and req.get("network") == getattr(payload, "network", None)
+                and req.get("scheme") == scheme
+                and req.get("network") == network
             ):
                 return PaymentHandler.parse_payment_requirements(req)
         return PaymentHandler.parse_payment_requirements(accepts[0])
@@ -157,9 +246,7 @@ class PaymentHandler:
             if settle_response.success:
                 # Settlement succeeded - complete task with receipt
                 md = build_payment_completed_metadata(
-                    settle_response.model_dump(by_alias=True)
-                    if hasattr(settle_response, "model_dump")
-                    else dict(settle_response)
+                    _settlement_receipt(settle_response)
                 )
 
                 # Call terminal state handler with payment metadata
@@ -169,9 +256,7 @@ class PaymentHandler:
                 await PaymentHandler._handle_settlement_failure(
                     task,
                     settle_response.error_reason or "settlement_failed",
-                    settle_response.model_dump(by_alias=True)
-                    if hasattr(settle_response, "model_dump")
-                    else dict(settle_response),
+                    _settlement_receipt(settle_response),
                     storage,
                     lifecycle_notifier,
                 )
@@ -205,10 +290,24 @@ class PaymentHandler:
         """
         md = build_payment_failed_metadata(error_reason, receipt)
         error_message = f"Payment settlement failed: {error_reason}"
-        err_msgs = MessageConverter.to_protocol_messages(
+        err_msgs = MessageConverter.to_error_message(
             error_message, task["id"], task["context_id"]
         )
 
+        if _BATCH_SETTLEMENT_FAILURES:
+            _enqueue_settlement_failure(
+                storage,
+                {
+                    "task_id": task["id"],
+                    "state": "input-required",
+                    "new_messages": err_msgs,
+                    "metadata": md,
+                },
+                task,
+                lifecycle_notifier,
+            )
+            return
+
         await storage.update_task(
             task["id"],
             state="input-required",
@@ -216,6 +315,18 @@ class PaymentHandler:
             metadata=md,
         )
 
+        await PaymentHandler._notify_input_required(task, lifecycle_notifier)
+
+    @staticmethod
+    async def _notify_input_required(
+        task: dict[str, Any], lifecycle_notifier: Any = None
+    ) -> None:
+        """Notify lifecycle listeners that the task went back to input-required.
+
+        Args:
+            task: Task dict
+            lifecycle_notifier: Optional lifecycle notification callback
+        """
         # Notify lifecycle if notifier is configured
         if lifecycle_notifier:
             try:
@@ -230,3 +341,133 @@ class PaymentHandler:
                     task_id=str(task["id"]),
                     error=str(e),
                 )
+
+    @staticmethod
+    async def drain_settlement_failures() -> None:
+        """Write any queued settlement failures and stop the background flusher.
+
+        Called on application shutdown so failures queued by the batching path
+        are persisted before storage is closed. A no-op when nothing was queued.
+        """
+        global _failure_queue, _failure_flusher
+
+        queue, flusher = _failure_queue, _failure_flusher
+        _failure_queue = _failure_flusher = None
+        if queue is None:
+            return
+
+        if (
+            flusher is not None
+            and not flusher.done()
+            and flusher.get_loop() is asyncio.get_running_loop()
+        ):
+            # The sentinel makes the flusher write what it holds and exit
+            queue.put_nowait(None)
+            await flusher
+            return
+
+        # The flusher died or belongs to another loop; write its leftovers here
+        batch = [item for item in _take_queued(queue) if item is not None]
+        if batch:
+            await _write_settlement_failures(batch)
+
+
+def _take_queued(queue: asyncio.Queue) -> list[Any]:
+    """Remove and return everything currently in the queue without waiting."""
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def _enqueue_settlement_failure(
+    storage: Any,
+    update: dict[str, Any],
+    task: dict[str, Any],
+    lifecycle_notifier: Any,
+) -> None:
+    """Queue a settlement failure update for the background flusher.
+
+    Starts the flusher on the running event loop on first use (or after the
+    loop changed). Entries left in the previous queue are carried over so the
+    new flusher writes them.
+
+    Args:
+        storage: Storage instance to write the update to
+        update: Keyword arguments for storage.update_task
+        task: Task dict
+        lifecycle_notifier: Optional lifecycle notification callback
+    """
+    global _failure_queue, _failure_flusher
+
+    loop = asyncio.get_running_loop()
+    if (
+        _failure_queue is None
+        or _failure_flusher is None
+        or _failure_flusher.done()
+        or _failure_flusher.get_loop() is not loop
+    ):
+        previous = _failure_queue
+        _failure_queue = asyncio.Queue()
+        if previous is not None:
+            for item in _take_queued(previous):
+                if item is not None:
+                    _failure_queue.put_nowait(item)
+        _failure_flusher = loop.create_task(_flush_settlement_failures(_failure_queue))
+    _failure_queue.put_nowait((storage, update, task, lifecycle_notifier))
+
+
+async def _flush_settlement_failures(queue: asyncio.Queue) -> None:
+    """Write queued settlement failures in batches until a None sentinel arrives.
+
+    Waits for the first failure, gives others _FAILURE_FLUSH_INTERVAL seconds
+    to arrive, and writes everything queued before notifying listeners.
+    If cancelled before a batch is written, the batch is put back on the queue.
+
+    Args:
+        queue: Queue of (storage, update, task, lifecycle_notifier) entries
+    """
+    while True:
+        first = await queue.get()
+        if first is None:
+            return
+        batch = [first]
+        try:
+            await asyncio.sleep(_FAILURE_FLUSH_INTERVAL)
+        except asyncio.CancelledError:
+            for item in batch:
+                queue.put_nowait(item)
+            raise
+
+        items = _take_queued(queue)
+        stop = None in items
+        batch.extend(item for item in items if item is not None)
+        await _write_settlement_failures(batch)
+        if stop:
+            return
+
+
+async def _write_settlement_failures(batch: list[tuple[Any, ...]]) -> None:
+    """Persist a batch of settlement failures, then notify listeners.
+
+    Each update is written on its own, so one failing write neither skips the
+    rest nor gets its task reported as input-required without being saved.
+
+    Args:
+        batch: (storage, update, task, lifecycle_notifier) entries
+    """
+    saved = []
+    for storage, update, task, lifecycle_notifier in batch:
+        try:
+            await storage.update_task(**update)
+        except Exception as e:
+            logger.error(
+                "Failed to persist batched settlement failure",
+                task_id=str(update["task_id"]),
+                error=str(e),
+            )
+            continue
+        saved.append((task, lifecycle_notifier))
+
+    for task, lifecycle_notifier in saved:
+        await PaymentHandler._notify_input_required(task, lifecycle_notifier)
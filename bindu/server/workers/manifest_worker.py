@@ -495,7 +495,7 @@ class ManifestWorker(Worker):
             task: Task that failed
             error: Error description
         """
-        error_message = MessageConverter.to_protocol_messages(
+        error_message = MessageConverter.to_error_message(
             f"Task execution failed: {error}", task["id"], task["context_id"]
         )
         await self.storage.update_task(
@@ -277,6 +277,10 @@ class ObservabilitySettings(BaseSettings):
         "opentelemetry-exporter-otlp",
     ]
 
+    # Detect installed agent frameworks and instrument them with OpenInference.
+    # Disable to keep only Bindu's own tracing and skip the package lookups.
+    framework_autodetect: bool = True
+
 
 class X402Settings(BaseSettings):
     """x402 payments configuration settings."""
@@ -582,6 +586,9 @@ class HydraSettings(BaseSettings):
     auto_register_agents: bool = True  # Auto-register agents as OAuth clients
     agent_client_prefix: str = "agent-"  # Prefix for agent client IDs
 
+    # fsync the credentials file before the atomic rename (slower, crash-safe)
+    durable_writes: bool = False
+
     # Default OAuth2 scopes for agents
     default_agent_scopes: list[str] = [
         "openid",
@@ -4,7 +4,11 @@ from .capabilities import (
     add_extension_to_capabilities,
     get_x402_extension_from_capabilities,
 )
-from .config_loader import load_config_from_env, update_auth_settings
+from .config_loader import (
+    load_config_from_env,
+    refresh_env_cache,
+    update_auth_settings,
+)
 from .did_utils import check_did_match, validate_did_extension
 from .env_loader import load_and_apply_env_file, load_env_file, resolve_path
 from .path_resolver import (
@@ -32,6 +36,7 @@ __all__ = [
     "check_did_match",
     # Configuration utilities
     "load_config_from_env",
+    "refresh_env_cache",
     "update_auth_settings",
     # Environment utilities
     "load_env_file",
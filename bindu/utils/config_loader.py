@@ -4,14 +4,217 @@ This module provides utilities for loading capability-specific configurations
 from environment variables and setting up infrastructure components.
 """
 
+import functools
 import os
-from typing import Any, Dict, cast, Literal
+import sys
+from collections import ChainMap
+from types import MappingProxyType, ModuleType
+from typing import Any, Callable, Dict, cast, Literal
 from urllib.parse import urlparse, urlunparse
 
+import orjson
+
+from bindu.settings import app_settings
+from bindu.tunneling.config import TunnelConfig
 from bindu.utils.logging import get_logger
 
 logger = get_logger("bindu.utils.config_loader")
 
+_models: ModuleType | None = None
+
+
+def _get_models() -> ModuleType:
+    """Return bindu.common.models, importing it on first use.
+
+    It cannot be imported at module scope: it pulls in the DID extension,
+    which imports bindu.utils while this module is still initializing.
+    """
+    global _models
+    if _models is None:
+        from bindu.common import models
+
+        _models = models
+    return _models
+
+
+# Snapshot of os.environ read by the helpers below. It is refreshed at the start
+# of every load_config_from_env() pass (and whenever a .env file is applied), so
+# one configuration pass reads one consistent environment without querying the
+# process environment for every variable.
+_env_cache: Dict[str, str] = dict(os.environ)
+
+
+def refresh_env_cache() -> None:
+    """Re-read os.environ into the snapshot used by this module."""
+    global _env_cache
+    _env_cache = dict(os.environ)
+
+
+def _get(name: str, default: str | None = None) -> str | None:
+    """Look up an environment variable in the cached snapshot."""
+    return _env_cache.get(name, default)
+
+
+def _env_first(*names: str) -> str | None:
+    """Return the first non-empty value among several variable names.
+
+    Args:
+        *names: Environment variable names, in order of precedence
+
+    Returns:
+        First non-empty value, or None if none is set
+    """
+    for name in names:
+        value = _env_cache.get(name)
+        if value:
+            return value
+    return None
+
+
+def _str_env(name: str) -> str | None:
+    """Read a string variable, treating an empty value as unset."""
+    return _env_cache.get(name) or None
+
+
+def _int_env(name: str, default: int | None = None) -> int | None:
+    """Read an integer variable from the cached environment snapshot.
+
+    A malformed value is logged and ignored rather than aborting startup.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset, empty or malformed
+
+    Returns:
+        Parsed integer, or default
+    """
+    value = _env_cache.get(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            "Ignoring invalid integer {name}={value!r}", name=name, value=value
+        )
+        return default
+
+
+# Shared read-only stand-in for a missing or empty capabilities section
+_EMPTY_MAPPING: MappingProxyType = MappingProxyType({})
+
+# Supported backends; anything else falls back to memory. Backend names read
+# from the environment or user config are interned so the equality checks
+# made against these literals later on short-circuit on identity.
+_STORAGE_TYPES: frozenset[str] = frozenset({"postgres", "memory"})
+_SCHEDULER_TYPES: frozenset[str] = frozenset({"redis", "memory"})
+
+# Backends picked by a *_TYPE variable, with the URL variable that becomes
+# required for the non-memory backend:
+# (config section, type env var, backend needing a URL, URL env var, URL key)
+_BACKEND_ENV_SCHEMA: tuple[tuple[str, str, str, str, str], ...] = (
+    ("storage", "STORAGE_TYPE", "postgres", "DATABASE_URL", "postgres_url"),
+    ("scheduler", "SCHEDULER_TYPE", "redis", "REDIS_URL", "redis_url"),
+)
+
+# TunnelConfig fields accepted from a user "tunnel" section
+_TUNNEL_FIELDS: tuple[str, ...] = (
+    "enabled",
+    "server_address",
+    "subdomain",
+    "tunnel_domain",
+    "protocol",
+    "use_tls",
+    "local_host",
+)
+# TunnelConfig string fields read from the environment: (field, env var)
+_TUNNEL_ENV_FIELDS: tuple[tuple[str, str], ...] = (
+    ("server_address", "TUNNEL_SERVER_ADDRESS"),
+    ("subdomain", "TUNNEL_SUBDOMAIN"),
+    ("tunnel_domain", "TUNNEL_DOMAIN"),
+    ("protocol", "TUNNEL_PROTOCOL"),
+    ("local_host", "TUNNEL_LOCAL_HOST"),
+)
+
+# Plain string settings copied from the environment: (config key, env var)
+_OLTP_ENV_FIELDS: tuple[tuple[str, str], ...] = (
+    ("oltp_endpoint", "OLTP_ENDPOINT"),
+    ("oltp_service_name", "OLTP_SERVICE_NAME"),
+)
+_WEBHOOK_ENV_FIELDS: tuple[tuple[str, str], ...] = (
+    ("global_webhook_url", "WEBHOOK_URL"),
+    ("global_webhook_token", "WEBHOOK_TOKEN"),
+)
+
+# Hydra settings read when AUTH__PROVIDER=hydra: (env var, auth key, reader)
+_HYDRA_ENV_FIELDS: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    ("HYDRA__ADMIN_URL", "admin_url", _str_env),
+    ("HYDRA__PUBLIC_URL", "public_url", _str_env),
+    ("HYDRA__TIMEOUT", "timeout", _int_env),
+    ("HYDRA__MAX_RETRIES", "max_retries", _int_env),
+    ("HYDRA__CACHE_TTL", "cache_ttl", _int_env),
+    ("HYDRA__MAX_CACHE_SIZE", "max_cache_size", _int_env),
+    ("HYDRA__AGENT_CLIENT_PREFIX", "agent_client_prefix", _str_env),
+)
+# Hydra flags that are always set and default to true: (env var, auth key)
+_HYDRA_BOOL_ENV_FIELDS: tuple[tuple[str, str], ...] = (
+    ("HYDRA__VERIFY_SSL", "verify_ssl"),
+    ("HYDRA__AUTO_REGISTER_AGENTS", "auto_register_agents"),
+)
+
+# app_settings.hydra / app_settings.vault fields that a config may override
+_HYDRA_SETTINGS_KEYS: tuple[str, ...] = (
+    "admin_url",
+    "public_url",
+    "timeout",
+    "verify_ssl",
+    "max_retries",
+    "cache_ttl",
+    "max_cache_size",
+    "auto_register_agents",
+    "agent_client_prefix",
+)
+_VAULT_SETTINGS_KEYS: tuple[str, ...] = ("enabled", "url", "token")
+
+_TRUTHY: frozenset[str] = frozenset({"true", "1", "yes"})
+
+# Exact spellings resolved without lowercasing; anything else falls back to
+# a case-insensitive _TRUTHY check
+_BOOL_MAP: Dict[str, bool] = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "": False,
+}
+
+
+def _bool_env(name: str, default: bool = False) -> bool:
+    """Read a boolean flag from the cached environment snapshot.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset
+
+    Returns:
+        True if the value is one of "true", "1" or "yes" (case-insensitive)
+    """
+    value = _env_cache.get(name)
+    if value is None:
+        return default
+    result = _BOOL_MAP.get(value)
+    if result is not None:
+        return result
+    return value.lower() in _TRUTHY
+
+
+@functools.lru_cache(maxsize=1)
+def _parsed_oltp_headers(raw: str) -> Any:
+    """Parse the OLTP_HEADERS JSON value, reusing the last result."""
+    return orjson.loads(raw)
+
 
 def create_storage_config_from_env(user_config: Dict[str, Any]):
     """Create StorageConfig from environment variables and user config.
@@ -22,35 +225,40 @@ def create_storage_config_from_env(user_config: Dict[str, Any]):
     Returns:
         StorageConfig instance or None if not configured
     """
-    from bindu.common.models import StorageConfig
+    StorageConfig = _get_models().StorageConfig
 
     # Check if user already provided storage config
     if "storage" in user_config:
         storage_dict = user_config["storage"]
         storage_type = storage_dict.get("type")
-        if storage_type not in ("postgres", "memory"):
+        if storage_type not in _STORAGE_TYPES:
             logger.warning(f"Invalid storage type: {storage_type}, using memory")
             storage_type = "memory"
+        storage_type = sys.intern(storage_type)
         return StorageConfig(
             type=storage_type,
             database_url=storage_dict.get("postgres_url"),
         )
 
     # Load from environment
-    storage_type = os.getenv("STORAGE_TYPE")
+    storage_type = _get("STORAGE_TYPE")
     if not storage_type:
         return None
 
-    if storage_type not in ("postgres", "memory"):
+    if storage_type not in _STORAGE_TYPES:
         logger.warning(f"Invalid storage type: {storage_type}, using memory")
         storage_type = "memory"
+    storage_type = sys.intern(storage_type)
 
-    logger.debug(f"Loaded STORAGE_TYPE from environment: {storage_type}")
+    logger.debug(
+        "Loaded STORAGE_TYPE from environment: {storage_type}",
+        storage_type=storage_type,
+    )
 
     # Get database URL from environment
     database_url = None
     if storage_type == "postgres":
-        database_url = os.getenv("DATABASE_URL")
+        database_url = _get("DATABASE_URL")
         if database_url:
             logger.debug("Loaded DATABASE_URL from environment")
 
@@ -69,35 +277,40 @@ def create_scheduler_config_from_env(user_config: Dict[str, Any]):
     Returns:
         SchedulerConfig instance or None if not configured
     """
-    from bindu.common.models import SchedulerConfig
+    SchedulerConfig = _get_models().SchedulerConfig
 
     # Check if user already provided scheduler config
     if "scheduler" in user_config:
         scheduler_dict = user_config["scheduler"]
         scheduler_type = scheduler_dict.get("type")
-        if scheduler_type not in ("redis", "memory"):
+        if scheduler_type not in _SCHEDULER_TYPES:
             logger.warning(f"Invalid scheduler type: {scheduler_type}, using memory")
             scheduler_type = "memory"
+        scheduler_type = sys.intern(scheduler_type)
         return SchedulerConfig(
             type=scheduler_type,
             redis_url=scheduler_dict.get("redis_url"),
         )
 
     # Load from environment
-    scheduler_type = os.getenv("SCHEDULER_TYPE")
+    scheduler_type = _get("SCHEDULER_TYPE")
     if not scheduler_type:
         return None
 
-    if scheduler_type not in ("redis", "memory"):
+    if scheduler_type not in _SCHEDULER_TYPES:
         logger.warning(f"Invalid scheduler type: {scheduler_type}, using memory")
         scheduler_type = "memory"
+    scheduler_type = sys.intern(scheduler_type)
 
-    logger.debug(f"Loaded SCHEDULER_TYPE from environment: {scheduler_type}")
+    logger.debug(
+        "Loaded SCHEDULER_TYPE from environment: {scheduler_type}",
+        scheduler_type=scheduler_type,
+    )
 
     # Get Redis URL from environment
     redis_url = None
     if scheduler_type == "redis":
-        redis_url = os.getenv("REDIS_URL")
+        redis_url = _get("REDIS_URL")
         if redis_url:
             logger.debug("Loaded REDIS_URL from environment")
 
@@ -115,42 +328,28 @@ def create_tunnel_config_from_env(user_config: Dict[str, Any]):
     Returns:
         TunnelConfig instance or None if not configured
     """
-    from bindu.tunneling.config import TunnelConfig
-
-    # Check if user already provided tunnel config
+    # Check if user already provided tunnel config; unset fields keep the
+    # TunnelConfig defaults (which come from app_settings.tunnel)
     if "tunnel" in user_config:
         tunnel_dict = user_config["tunnel"]
         return TunnelConfig(
-            enabled=tunnel_dict.get("enabled", False),
-            server_address=tunnel_dict.get("server_address", "142.132.241.44:7000"),
-            subdomain=tunnel_dict.get("subdomain"),
-            tunnel_domain=tunnel_dict.get("tunnel_domain", "tunnel.getbindu.com"),
-            protocol=tunnel_dict.get("protocol", "http"),
-            use_tls=tunnel_dict.get("use_tls", False),
-            local_host=tunnel_dict.get("local_host", "127.0.0.1"),
+            **{key: tunnel_dict[key] for key in _TUNNEL_FIELDS if key in tunnel_dict}
         )
 
     # Load from environment
-    tunnel_enabled = os.getenv("TUNNEL_ENABLED", "false").lower() in (
-        "true",
-        "1",
-        "yes",
-    )
+    tunnel_enabled = _bool_env("TUNNEL_ENABLED")
 
     if not tunnel_enabled:
         return None
 
     logger.debug("Tunnel enabled from environment")
 
-    return TunnelConfig(
-        enabled=True,
-        server_address=os.getenv("TUNNEL_SERVER_ADDRESS", "142.132.241.44:7000"),
-        subdomain=os.getenv("TUNNEL_SUBDOMAIN"),
-        tunnel_domain=os.getenv("TUNNEL_DOMAIN", "tunnel.getbindu.com"),
-        protocol=os.getenv("TUNNEL_PROTOCOL", "http"),
-        use_tls=os.getenv("TUNNEL_USE_TLS", "false").lower() in ("true", "1", "yes"),
-        local_host=os.getenv("TUNNEL_LOCAL_HOST", "127.0.0.1"),
-    )
+    overrides = {
+        key: value
+        for key, env_name in _TUNNEL_ENV_FIELDS
+        if (value := _get(env_name)) is not None
+    }
+    return TunnelConfig(enabled=True, use_tls=_bool_env("TUNNEL_USE_TLS"), **overrides)
 
 
 def create_sentry_config_from_env(user_config: Dict[str, Any]):
@@ -162,7 +361,7 @@ def create_sentry_config_from_env(user_config: Dict[str, Any]):
     Returns:
         SentryConfig instance or None if not configured
     """
-    from bindu.common.models import SentryConfig
+    SentryConfig = _get_models().SentryConfig
 
     # Check if user already provided sentry config
     if "sentry" in user_config:
@@ -182,19 +381,15 @@ def create_sentry_config_from_env(user_config: Dict[str, Any]):
         )
 
     # Load from environment
-    sentry_enabled = os.getenv("SENTRY_ENABLED", "false").lower() in (
-        "true",
-        "1",
-        "yes",
-    )
+    sentry_enabled = _bool_env("SENTRY_ENABLED")
     if not sentry_enabled:
         return None
 
-    from bindu.settings import app_settings
-
-    sentry_dsn = os.getenv("SENTRY_DSN")
+    sentry_dsn = _get("SENTRY_DSN")
     logger.debug(
-        f"Loaded Sentry configuration: enabled={sentry_enabled}, dsn={'***' if sentry_dsn else 'None'}"
+        "Loaded Sentry configuration: enabled={enabled}, dsn={dsn}",
+        enabled=sentry_enabled,
+        dsn="***" if sentry_dsn else "None",
     )
 
     return SentryConfig(
@@ -227,22 +422,28 @@ def load_config_from_env(config: Dict[str, Any]) -> Dict[str, Any]:
         config: User-provided configuration dictionary
 
     Returns:
-        Configuration dictionary with environment variable fallbacks
+        Configuration dictionary with environment variable fallbacks (the
+        input itself when the environment adds nothing)
     """
-    # Create a copy to avoid mutating the input
-    enriched_config = config.copy()
-    capabilities = enriched_config.get("capabilities", {})
+    refresh_env_cache()
+
+    # Writes land in the first map, so the input is never mutated at the top
+    # level and only has to be copied if something was actually added
+    enriched_config: ChainMap[str, Any] = ChainMap({}, config)
+    capabilities = enriched_config.get("capabilities") or _EMPTY_MAPPING
+    # Names (and non-secret values) of the env vars applied, logged once at the end
+    loaded: list[str] = []
 
     # Deployment configuration - support environment-based URL/port overrides
     deployment_dict = enriched_config.get("deployment")
     if isinstance(deployment_dict, dict):
-        deployment_url_override = os.getenv("BINDU_DEPLOYMENT_URL")
-        deployment_host_override = os.getenv("BINDU_HOST")
-        deployment_port_override = os.getenv("BINDU_PORT") or os.getenv("PORT")
+        deployment_url_override = _get("BINDU_DEPLOYMENT_URL")
+        deployment_host_override = _get("BINDU_HOST")
+        deployment_port_override = _env_first("BINDU_PORT", "PORT")
 
         if deployment_url_override:
             deployment_dict["url"] = deployment_url_override
-            logger.debug("Loaded BINDU_DEPLOYMENT_URL from environment")
+            loaded.append("BINDU_DEPLOYMENT_URL")
         elif deployment_host_override or deployment_port_override:
             existing_url = deployment_dict.get("url", "http://localhost:3773")
             parsed_url = urlparse(existing_url)
@@ -272,49 +473,33 @@ def load_config_from_env(config: Dict[str, Any]) -> Dict[str, Any]:
                     parsed_url.fragment,
                 )
             )
-            logger.debug(
-                f"Applied deployment override from environment: {deployment_dict['url']}"
-            )
-
-    # Storage configuration - load from env if not in user config
-    if "storage" not in enriched_config:
-        storage_type = os.getenv("STORAGE_TYPE", "memory")
-        if storage_type:
-            enriched_config["storage"] = {"type": storage_type}
-            if storage_type == "postgres":
-                database_url = os.getenv("DATABASE_URL")
-                if not database_url:
-                    raise ValueError(
-                        "DATABASE_URL environment variable is required when STORAGE_TYPE=postgres"
-                    )
-                enriched_config["storage"]["postgres_url"] = database_url
-                logger.debug("Loaded DATABASE_URL from environment")
-            logger.debug(f"Loaded STORAGE_TYPE from environment: {storage_type}")
-
-    # Scheduler configuration - load from env if not in user config
-    if "scheduler" not in enriched_config:
-        scheduler_type = os.getenv("SCHEDULER_TYPE", "memory")
-        if scheduler_type:
-            enriched_config["scheduler"] = {"type": scheduler_type}
-            if scheduler_type == "redis":
-                redis_url = os.getenv("REDIS_URL")
-                if not redis_url:
-                    raise ValueError(
-                        "REDIS_URL environment variable is required when SCHEDULER_TYPE=redis"
-                    )
-                enriched_config["scheduler"]["redis_url"] = redis_url
-                logger.debug("Loaded REDIS_URL from environment")
-            logger.debug(f"Loaded SCHEDULER_TYPE from environment: {scheduler_type}")
+            loaded.append(f"deployment.url={deployment_dict['url']}")
+
+    # Storage and scheduler backends - load from env if not in user config
+    for section, type_env, url_backend, url_env, url_key in _BACKEND_ENV_SCHEMA:
+        if section in enriched_config:
+            continue
+        backend = _get(type_env, "memory")
+        if not backend:
+            continue
+        backend = sys.intern(backend)
+        enriched_config[section] = {"type": backend}
+        if backend == url_backend:
+            url = _get(url_env)
+            if not url:
+                raise ValueError(
+                    f"{url_env} environment variable is required when "
+                    f"{type_env}={url_backend}"
+                )
+            enriched_config[section][url_key] = url
+            loaded.append(url_env)
+        loaded.append(f"{type_env}={backend}")
 
     # Sentry configuration - load from env if not in user config
     if "sentry" not in enriched_config:
-        sentry_enabled = os.getenv("SENTRY_ENABLED", "false").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        sentry_enabled = _bool_env("SENTRY_ENABLED")
         if sentry_enabled:
-            sentry_dsn = os.getenv("SENTRY_DSN")
+            sentry_dsn = _get("SENTRY_DSN")
             if not sentry_dsn:
                 raise ValueError(
                     "SENTRY_DSN environment variable is required when SENTRY_ENABLED=true"
@@ -323,65 +508,51 @@ def load_config_from_env(config: Dict[str, Any]) -> Dict[str, Any]:
                 "enabled": True,
                 "dsn": sentry_dsn,
             }
-            logger.debug(
-                f"Loaded Sentry configuration from environment: enabled={sentry_enabled}"
-            )
+            loaded.append("SENTRY_ENABLED")
 
     # Telemetry configuration - load from env if not in user config
     if "telemetry" not in enriched_config:
-        telemetry_enabled = os.getenv("TELEMETRY_ENABLED", "true").lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        telemetry_enabled = _bool_env("TELEMETRY_ENABLED", True)
         enriched_config["telemetry"] = telemetry_enabled
-        logger.debug(f"Loaded TELEMETRY_ENABLED from environment: {telemetry_enabled}")
+        loaded.append(f"TELEMETRY_ENABLED={telemetry_enabled}")
 
     # OLTP (OpenTelemetry Protocol) configuration - only load if telemetry is enabled
     if enriched_config.get("telemetry"):
-        if "oltp_endpoint" not in enriched_config:
-            oltp_endpoint = os.getenv("OLTP_ENDPOINT")
-            if oltp_endpoint:
-                enriched_config["oltp_endpoint"] = oltp_endpoint
-                logger.debug(f"Loaded OLTP_ENDPOINT from environment: {oltp_endpoint}")
-
-        if "oltp_service_name" not in enriched_config:
-            oltp_service_name = os.getenv("OLTP_SERVICE_NAME")
-            if oltp_service_name:
-                enriched_config["oltp_service_name"] = oltp_service_name
-                logger.debug(
-                    f"Loaded OLTP_SERVICE_NAME from environment: {oltp_service_name}"
-                )
+        for key, env_name in _OLTP_ENV_FIELDS:
+            if key not in enriched_config:
+                value = _get(env_name)
+                if value:
+                    enriched_config[key] = value
+                    loaded.append(f"{env_name}={value}")
 
         if "oltp_headers" not in enriched_config:
-            oltp_headers_str = os.getenv("OLTP_HEADERS")
+            oltp_headers_str = _get("OLTP_HEADERS")
             if oltp_headers_str:
-                import json
-
                 try:
-                    enriched_config["oltp_headers"] = json.loads(oltp_headers_str)
-                    logger.debug("Loaded OLTP_HEADERS from environment")
-                except json.JSONDecodeError as e:
+                    oltp_headers = _parsed_oltp_headers(oltp_headers_str)
+                    # Hand out a copy so callers never mutate the cached dict
+                    enriched_config["oltp_headers"] = (
+                        dict(oltp_headers)
+                        if isinstance(oltp_headers, dict)
+                        else oltp_headers
+                    )
+                    loaded.append("OLTP_HEADERS")
+                except orjson.JSONDecodeError as e:
                     raise ValueError(f"Invalid OLTP_HEADERS format, expected JSON: {e}")
 
     # Push notifications and negotiation - only if push_notifications capability is enabled
     if capabilities.get("push_notifications"):
         # Webhook configuration
-        if not enriched_config.get("global_webhook_url"):
-            webhook_url = os.getenv("WEBHOOK_URL")
-            if webhook_url:
-                enriched_config["global_webhook_url"] = webhook_url
-                logger.debug("Loaded WEBHOOK_URL from environment")
-
-        if not enriched_config.get("global_webhook_token"):
-            webhook_token = os.getenv("WEBHOOK_TOKEN")
-            if webhook_token:
-                enriched_config["global_webhook_token"] = webhook_token
-                logger.debug("Loaded WEBHOOK_TOKEN from environment")
+        for key, env_name in _WEBHOOK_ENV_FIELDS:
+            if not enriched_config.get(key):
+                value = _get(env_name)
+                if value:
+                    enriched_config[key] = value
+                    loaded.append(env_name)
 
         # Negotiation API key for embeddings
         if capabilities.get("negotiation"):
-            env_openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
+            env_openrouter_api_key = _get("OPENROUTER_API_KEY")
             if env_openrouter_api_key:
                 if "negotiation" not in enriched_config:
                     enriched_config["negotiation"] = {}
@@ -389,83 +560,38 @@ def load_config_from_env(config: Dict[str, Any]) -> Dict[str, Any]:
                     enriched_config["negotiation"]["embedding_api_key"] = (
                         env_openrouter_api_key
                     )
-                    logger.debug("Loaded OPENROUTER_API_KEY from environment")
+                    loaded.append("OPENROUTER_API_KEY")
 
     # Authentication configuration - load from env if not in user config
     if "auth" not in enriched_config:
-        auth_enabled = os.getenv("AUTH__ENABLED", "").lower() in ("true", "1", "yes")
-        auth_provider = os.getenv("AUTH__PROVIDER", "").lower()
+        auth_enabled = _bool_env("AUTH__ENABLED")
+        auth_provider = sys.intern(_get("AUTH__PROVIDER", "").lower())
 
         if auth_enabled and auth_provider:
             enriched_config["auth"] = {
                 "enabled": auth_enabled,
                 "provider": auth_provider,
             }
-            logger.debug(
-                f"Loaded AUTH__ENABLED={auth_enabled} and AUTH__PROVIDER={auth_provider} from environment"
-            )
+            loaded.append(f"AUTH__PROVIDER={auth_provider}")
 
             # Load provider-specific configuration
             if auth_provider == "hydra":
-                hydra_admin_url = os.getenv("HYDRA__ADMIN_URL")
-                if hydra_admin_url:
-                    enriched_config["auth"]["admin_url"] = hydra_admin_url
-                    logger.debug("Loaded HYDRA__ADMIN_URL from environment")
-
-                hydra_public_url = os.getenv("HYDRA__PUBLIC_URL")
-                if hydra_public_url:
-                    enriched_config["auth"]["public_url"] = hydra_public_url
-                    logger.debug("Loaded HYDRA__PUBLIC_URL from environment")
-
-                # Connection settings
-                hydra_timeout = os.getenv("HYDRA__TIMEOUT")
-                if hydra_timeout:
-                    enriched_config["auth"]["timeout"] = int(hydra_timeout)
-                    logger.debug("Loaded HYDRA__TIMEOUT from environment")
-
-                hydra_verify_ssl = os.getenv("HYDRA__VERIFY_SSL", "true").lower() in (
-                    "true",
-                    "1",
-                    "yes",
-                )
-                enriched_config["auth"]["verify_ssl"] = hydra_verify_ssl
-                logger.debug("Loaded HYDRA__VERIFY_SSL from environment")
-
-                hydra_max_retries = os.getenv("HYDRA__MAX_RETRIES")
-                if hydra_max_retries:
-                    enriched_config["auth"]["max_retries"] = int(hydra_max_retries)
-                    logger.debug("Loaded HYDRA__MAX_RETRIES from environment")
-
-                # Cache settings
-                hydra_cache_ttl = os.getenv("HYDRA__CACHE_TTL")
-                if hydra_cache_ttl:
-                    enriched_config["auth"]["cache_ttl"] = int(hydra_cache_ttl)
-                    logger.debug("Loaded HYDRA__CACHE_TTL from environment")
-
-                hydra_max_cache_size = os.getenv("HYDRA__MAX_CACHE_SIZE")
-                if hydra_max_cache_size:
-                    enriched_config["auth"]["max_cache_size"] = int(
-                        hydra_max_cache_size
-                    )
-                    logger.debug("Loaded HYDRA__MAX_CACHE_SIZE from environment")
-
-                # Auto-registration settings
-                hydra_auto_register = os.getenv(
-                    "HYDRA__AUTO_REGISTER_AGENTS", "true"
-                ).lower() in ("true", "1", "yes")
-                enriched_config["auth"]["auto_register_agents"] = hydra_auto_register
-                logger.debug("Loaded HYDRA__AUTO_REGISTER_AGENTS from environment")
+                auth = enriched_config["auth"]
+                for env_name, key, read in _HYDRA_ENV_FIELDS:
+                    value = read(env_name)
+                    if value is not None:
+                        auth[key] = value
+                        loaded.append(env_name)
 
-                hydra_client_prefix = os.getenv("HYDRA__AGENT_CLIENT_PREFIX")
-                if hydra_client_prefix:
-                    enriched_config["auth"]["agent_client_prefix"] = hydra_client_prefix
-                    logger.debug("Loaded HYDRA__AGENT_CLIENT_PREFIX from environment")
+                for env_name, key in _HYDRA_BOOL_ENV_FIELDS:
+                    auth[key] = _bool_env(env_name, True)
+                    loaded.append(env_name)
 
     # Vault configuration - load from env if not in user config
     if "vault" not in enriched_config:
-        vault_enabled = os.getenv("VAULT__ENABLED", "").lower() in ("true", "1", "yes")
-        vault_url = os.getenv("VAULT__URL") or os.getenv("VAULT_ADDR")
-        vault_token = os.getenv("VAULT__TOKEN") or os.getenv("VAULT_TOKEN")
+        vault_enabled = _bool_env("VAULT__ENABLED")
+        vault_url = _env_first("VAULT__URL", "VAULT_ADDR")
+        vault_token = _env_first("VAULT__TOKEN", "VAULT_TOKEN")
 
         if vault_enabled or vault_url or vault_token:
             enriched_config["vault"] = {
@@ -473,12 +599,19 @@ def load_config_from_env(config: Dict[str, Any]) -> Dict[str, Any]:
             }
             if vault_url:
                 enriched_config["vault"]["url"] = vault_url
-                logger.debug(f"Loaded Vault URL from environment: {vault_url}")
+                loaded.append(f"VAULT_URL={vault_url}")
             if vault_token:
                 enriched_config["vault"]["token"] = vault_token
-                logger.debug("Loaded Vault token from environment")
+                loaded.append("VAULT_TOKEN")
 
-    return enriched_config
+    if loaded:
+        logger.debug(
+            "Loaded configuration from environment: {env_vars}",
+            env_vars=", ".join(loaded),
+        )
+
+    overrides = enriched_config.maps[0]
+    return {**config, **overrides} if overrides else config
 
 
 def create_auth_config_from_env(user_config: Dict[str, Any]) -> Dict[str, Any] | None:
@@ -517,8 +650,6 @@ def update_auth_settings(auth_config: Dict[str, Any]) -> None:
     Args:
         auth_config: Authentication configuration dictionary
     """
-    from bindu.settings import app_settings
-
     if auth_config and auth_config.get("enabled"):
         # Auth is enabled - configure provider
         app_settings.auth.enabled = True
@@ -527,37 +658,13 @@ def update_auth_settings(auth_config: Dict[str, Any]) -> None:
         provider = auth_config.get("provider", "hydra")
 
         if provider == "hydra":
-            # Hydra-specific settings
-            from bindu.settings import app_settings
-
-            app_settings.hydra.enabled = True
-            app_settings.hydra.admin_url = auth_config.get(
-                "admin_url", app_settings.hydra.admin_url
-            )
-            app_settings.hydra.public_url = auth_config.get(
-                "public_url", app_settings.hydra.public_url
-            )
-            app_settings.hydra.timeout = auth_config.get(
-                "timeout", app_settings.hydra.timeout
-            )
-            app_settings.hydra.verify_ssl = auth_config.get(
-                "verify_ssl", app_settings.hydra.verify_ssl
-            )
-            app_settings.hydra.max_retries = auth_config.get(
-                "max_retries", app_settings.hydra.max_retries
-            )
-            app_settings.hydra.cache_ttl = auth_config.get(
-                "cache_ttl", app_settings.hydra.cache_ttl
-            )
-            app_settings.hydra.max_cache_size = auth_config.get(
-                "max_cache_size", app_settings.hydra.max_cache_size
-            )
-            app_settings.hydra.auto_register_agents = auth_config.get(
-                "auto_register_agents", app_settings.hydra.auto_register_agents
-            )
-            app_settings.hydra.agent_client_prefix = auth_config.get(
-                "agent_client_prefix", app_settings.hydra.agent_client_prefix
-            )
+            # Hydra-specific settings; keys absent from auth_config keep the
+            # current setting
+            hydra = app_settings.hydra
+            hydra.enabled = True
+            for key in _HYDRA_SETTINGS_KEYS:
+                if key in auth_config:
+                    setattr(hydra, key, auth_config[key])
         else:
             logger.warning(f"Unknown authentication provider: {provider}")
 
@@ -568,16 +675,13 @@ def update_vault_settings(vault_config: Dict[str, Any]) -> None:
     Args:
         vault_config: Vault configuration dictionary
     """
-    from bindu.settings import app_settings
-
     if vault_config:
-        app_settings.vault.enabled = vault_config.get(
-            "enabled", app_settings.vault.enabled
-        )
-        app_settings.vault.url = vault_config.get("url", app_settings.vault.url)
-        app_settings.vault.token = vault_config.get("token", app_settings.vault.token)
+        vault = app_settings.vault
+        for key in _VAULT_SETTINGS_KEYS:
+            if key in vault_config:
+                setattr(vault, key, vault_config[key])
 
-        if app_settings.vault.enabled:
-            logger.info(f"Vault integration enabled: {app_settings.vault.url}")
+        if vault.enabled:
+            logger.info(f"Vault integration enabled: {vault.url}")
         else:
             logger.debug("Vault integration disabled")
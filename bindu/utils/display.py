@@ -2,15 +2,142 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import sys
-
-from rich.align import Align
-from rich.console import Console, Group
-from rich.panel import Panel
-from rich.text import Text
+from typing import TYPE_CHECKING
 
 from bindu.__version__ import __version__
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+
+# ASCII art with gradient colors
+_ASCII_ART = (
+    r"[cyan]}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}[/cyan]"
+    "\n"
+    r"[cyan]{{[/cyan]            [yellow]+[/yellow]             [yellow]+[/yellow]"
+    r"                  [yellow]+[/yellow]   [yellow]@[/yellow]          [cyan]{{[/cyan]"
+    "\n"
+    r"[cyan]}}[/cyan]   [yellow]|[/yellow]                [yellow]*[/yellow]           "
+    r"[yellow]o[/yellow]     [yellow]+[/yellow]                [yellow].[/yellow]    [cyan]}}[/cyan]"
+    "\n"
+    r"[cyan]{{[/cyan]  [yellow]-O-[/yellow]    [yellow]o[/yellow]               [yellow].[/yellow]"
+    r"               [yellow].[/yellow]          [yellow]+[/yellow]       [cyan]{{[/cyan]"
+    "\n"
+    r"[cyan]}}[/cyan]   [yellow]|[/yellow]                    [magenta]_,.-----.,_[/magenta]"
+    r"         [yellow]o[/yellow]    [yellow]|[/yellow]          [cyan]}}[/cyan]"
+    "\n"
+    r"[cyan]{{[/cyan]           [yellow]+[/yellow]    [yellow]*[/yellow]    [magenta].-'.         .'-.          "
+    r"-O-[/magenta]         [cyan]{{[/cyan]"
+    "\n"
+    r"[cyan]}}[/cyan]      [yellow]*[/yellow]            [magenta].'.-'   .---.   `'.'.[/magenta]"
+    r"         [yellow]|[/yellow]     [yellow]*[/yellow]    [cyan]}}[/cyan]"
+    "\n"
+    r"[cyan]{{[/cyan] [yellow].[/yellow]                [magenta]/_.-'   /     \   .'-.[/magenta]\\"
+    r"                   [cyan]{{[/cyan]"
+    "\n"
+    r"[cyan]}}[/cyan]         [yellow]'[/yellow] [yellow]-=*<[/yellow]  [magenta]|-._.-  |   @   |   '-._|"
+    r"[/magenta]  [yellow]>*=-[/yellow]    [yellow].[/yellow]     [yellow]+[/yellow] [cyan]}}[/cyan]"
+    "\n"
+    r"[cyan]{{[/cyan] [yellow]-- )--[/yellow]           [magenta]\`-.    \     /    .-'/[/magenta]"
+    r"                   [cyan]{{[/cyan]"
+    "\n"
+    r"[cyan]}}[/cyan]       [yellow]*[/yellow]     [yellow]+[/yellow]     [magenta]`.'.    '---'    .'.'[/magenta]"
+    r"    [yellow]+[/yellow]       [yellow]o[/yellow]       [cyan]}}[/cyan]"
+    "\n"
+    r"[cyan]{{[/cyan]                  [yellow].[/yellow]  [magenta]'-._         _.-'[/magenta]  [yellow].[/yellow]"
+    r"                   [cyan]{{[/cyan]"
+    "\n"
+    r"[cyan]}}[/cyan]         [yellow]|[/yellow]               [magenta]`~~~~~~~`[/magenta]"
+    r"       [yellow]- --===D[/yellow]       [yellow]@[/yellow]   [cyan]}}[/cyan]"
+    "\n"
+    r"[cyan]{{[/cyan]   [yellow]o[/yellow]    [yellow]-O-[/yellow]      [yellow]*[/yellow]   [yellow].[/yellow]"
+    r"                  [yellow]*[/yellow]        [yellow]+[/yellow]          [cyan]{{[/cyan]"
+    "\n"
+    r"[cyan]}}[/cyan]         [yellow]|[/yellow]                      [yellow]+[/yellow]"
+    r"         [yellow].[/yellow]            [yellow]+[/yellow]    [cyan]}}[/cyan]"
+    "\n"
+    r"[cyan]{{[/cyan] [dim]jgs[/dim]          [yellow].[/yellow]     [yellow]@[/yellow]      [yellow]o[/yellow]"
+    r"                        [yellow]*[/yellow]       [cyan]{{[/cyan]"
+    "\n"
+    r"[cyan]}}[/cyan]       [yellow]o[/yellow]                          [yellow]*[/yellow]"
+    r"          [yellow]o[/yellow]           [yellow].[/yellow]  [cyan]}}[/cyan]"
+    "\n"
+    r"[cyan]{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{[/cyan]"
+)
+
+_VERSION_LINE = f"[bold white]Version: {__version__}[/bold white]"
+_COMMUNITY_BLOCK = "\n".join(
+    (
+        "[bold yellow]⭐️⭐️⭐️ Support Open Source ⭐️⭐️⭐️[/bold yellow]",
+        "[bold yellow]⭐️⭐️⭐️ Star on GitHub! ⭐️⭐️⭐️[/bold yellow]",
+        "[cyan underline]https://github.com/getbindu/Bindu[/cyan underline]",
+        "",
+        "[bold green]Join our Community 🤝[/bold green]",
+        "[cyan underline]https://discord.gg/3w5zuYUuwt[/cyan underline]",
+        "",
+        "[bold blue]Documentation 🌻[/bold blue]",
+        "[cyan underline]https://docs.getbindu.com[/cyan underline]",
+        "",
+    )
+)
+
+# Token request shown when OAuth credentials are available. The only
+# placeholder is {client_id}; the text itself contains no markup tags.
+_CURL_TEMPLATE = (
+    "curl -X POST https://hydra.getbindu.com/oauth2/token \\\n"
+    '  -H "Content-Type: application/x-www-form-urlencoded" \\\n'
+    '  -d "grant_type=client_credentials" \\\n'
+    '  -d "client_id={client_id}" \\\n'
+    '  -d "client_secret=<YOUR_CLIENT_SECRET>" \\\n'
+    '  -d "scope=openid offline agent:read agent:write"'
+)
+
+_STDOUT_RECONFIGURED = False
+
+
+@functools.lru_cache(maxsize=1)
+def _banner() -> tuple[Console, Panel]:
+    """Build the shared console and the ASCII art banner panel.
+
+    rich is imported here rather than at module scope so importing this
+    module stays cheap when the banner is never shown.
+    """
+    from rich.align import Align
+    from rich.console import Console, Group
+    from rich.panel import Panel
+    from rich.text import Text
+
+    tagline = Text("a bindu, part of Night Sky", style="italic magenta")
+    title = Text("Bindu 🌻", style="bold magenta")
+    # ASCII art and tagline grouped together for the banner panel
+    panel_content = Group(Align.center(_ASCII_ART), "", Align.center(tagline))
+    panel = Panel(
+        panel_content, title=title, border_style="bright_cyan", padding=(1, 2)
+    )
+    # All output is explicitly styled, so the repr highlighter is never wanted
+    return Console(highlight=False), panel
+
+
+def _ensure_utf8_stdout() -> None:
+    """Switch stdout to UTF-8 once per process.
+
+    Forces UTF-8 output on Windows to avoid cp1252 UnicodeEncodeError when
+    rich renders emoji (e.g. in Panel titles). reconfigure() changes the
+    encoding in-place without closing stdout.
+    """
+    global _STDOUT_RECONFIGURED
+    if _STDOUT_RECONFIGURED:
+        return
+    _STDOUT_RECONFIGURED = True
+    if hasattr(sys.stdout, "reconfigure"):
+        try:
+            sys.stdout.reconfigure(encoding="utf-8", errors="replace")  # type: ignore[call-non-callable]
+        except Exception:
+            pass
+
 
 def prepare_server_display(
     host: str | None = None,
@@ -32,178 +159,88 @@ def prepare_server_display(
         client_secret: OAuth client secret for token retrieval
         tunnel_url: Public tunnel URL if tunneling is enabled
     """
-    # Force UTF-8 output on Windows to avoid cp1252 UnicodeEncodeError when
-    # rich renders emoji (e.g. in Panel titles). reconfigure() changes the
-    # encoding in-place without closing stdout.
-    if hasattr(sys.stdout, "reconfigure"):
-        try:
-            sys.stdout.reconfigure(encoding="utf-8", errors="replace")  # type: ignore[call-non-callable]
-        except Exception:
-            pass
-    console = Console()
-
-    # ASCII art with gradient colors
-    ascii_art = (
-        r"[cyan]}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}[/cyan]"
-        "\n"
-        r"[cyan]{{[/cyan]            [yellow]+[/yellow]             [yellow]+[/yellow]"
-        r"                  [yellow]+[/yellow]   [yellow]@[/yellow]          [cyan]{{[/cyan]"
-        "\n"
-        r"[cyan]}}[/cyan]   [yellow]|[/yellow]                [yellow]*[/yellow]           "
-        r"[yellow]o[/yellow]     [yellow]+[/yellow]                [yellow].[/yellow]    [cyan]}}[/cyan]"
-        "\n"
-        r"[cyan]{{[/cyan]  [yellow]-O-[/yellow]    [yellow]o[/yellow]               [yellow].[/yellow]"
-        r"               [yellow].[/yellow]          [yellow]+[/yellow]       [cyan]{{[/cyan]"
-        "\n"
-        r"[cyan]}}[/cyan]   [yellow]|[/yellow]                    [magenta]_,.-----.,_[/magenta]"
-        r"         [yellow]o[/yellow]    [yellow]|[/yellow]          [cyan]}}[/cyan]"
-        "\n"
-        r"[cyan]{{[/cyan]           [yellow]+[/yellow]    [yellow]*[/yellow]    [magenta].-'.         .'-.          "
-        r"-O-[/magenta]         [cyan]{{[/cyan]"
-        "\n"
-        r"[cyan]}}[/cyan]      [yellow]*[/yellow]            [magenta].'.-'   .---.   `'.'.[/magenta]"
-        r"         [yellow]|[/yellow]     [yellow]*[/yellow]    [cyan]}}[/cyan]"
-        "\n"
-        r"[cyan]{{[/cyan] [yellow].[/yellow]                [magenta]/_.-'   /     \   .'-.[/magenta]\\"
-        r"                   [cyan]{{[/cyan]"
-        "\n"
-        r"[cyan]}}[/cyan]         [yellow]'[/yellow] [yellow]-=*<[/yellow]  [magenta]|-._.-  |   @   |   '-._|"
-        r"[/magenta]  [yellow]>*=-[/yellow]    [yellow].[/yellow]     [yellow]+[/yellow] [cyan]}}[/cyan]"
-        "\n"
-        r"[cyan]{{[/cyan] [yellow]-- )--[/yellow]           [magenta]\`-.    \     /    .-'/[/magenta]"
-        r"                   [cyan]{{[/cyan]"
-        "\n"
-        r"[cyan]}}[/cyan]       [yellow]*[/yellow]     [yellow]+[/yellow]     [magenta]`.'.    '---'    .'.'[/magenta]"
-        r"    [yellow]+[/yellow]       [yellow]o[/yellow]       [cyan]}}[/cyan]"
-        "\n"
-        r"[cyan]{{[/cyan]                  [yellow].[/yellow]  [magenta]'-._         _.-'[/magenta]  [yellow].[/yellow]"
-        r"                   [cyan]{{[/cyan]"
-        "\n"
-        r"[cyan]}}[/cyan]         [yellow]|[/yellow]               [magenta]`~~~~~~~`[/magenta]"
-        r"       [yellow]- --===D[/yellow]       [yellow]@[/yellow]   [cyan]}}[/cyan]"
-        "\n"
-        r"[cyan]{{[/cyan]   [yellow]o[/yellow]    [yellow]-O-[/yellow]      [yellow]*[/yellow]   [yellow].[/yellow]"
-        r"                  [yellow]*[/yellow]        [yellow]+[/yellow]          [cyan]{{[/cyan]"
-        "\n"
-        r"[cyan]}}[/cyan]         [yellow]|[/yellow]                      [yellow]+[/yellow]"
-        r"         [yellow].[/yellow]            [yellow]+[/yellow]    [cyan]}}[/cyan]"
-        "\n"
-        r"[cyan]{{[/cyan] [dim]jgs[/dim]          [yellow].[/yellow]     [yellow]@[/yellow]      [yellow]o[/yellow]"
-        r"                        [yellow]*[/yellow]       [cyan]{{[/cyan]"
-        "\n"
-        r"[cyan]}}[/cyan]       [yellow]o[/yellow]                          [yellow]*[/yellow]"
-        r"          [yellow]o[/yellow]           [yellow].[/yellow]  [cyan]}}[/cyan]"
-        "\n"
-        r"[cyan]{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{{[/cyan]"
-    )
-
-    # Create tagline
-    tagline = Text("a bindu, part of Night Sky", style="italic magenta")
-
-    # Group ASCII art and tagline together
-    title = Text("Bindu 🌻", style="bold magenta")
-    panel_content = Group(Align.center(ascii_art), "", Align.center(tagline))
-
-    # Print ASCII art panel
-    console.print()
-    console.print(
-        Panel(panel_content, title=title, border_style="bright_cyan", padding=(1, 2))
-    )
-    console.print()
-
-    # Print version
-    console.print(Text(f"Version: {__version__}", style="bold white"), highlight=False)
-    console.print()
-
-    # Print server information
+    # BINDU_QUIET skips the banner entirely (containers, systemd units) and
+    # leaves a single plain line so the startup is still visible in logs
+    if os.getenv("BINDU_QUIET", "").strip().lower() in ("1", "true", "yes"):
+        where = f" on {host}:{port}" if host and port else ""
+        sys.stdout.write(f"Bindu {__version__}{where}\n")
+        sys.stdout.flush()
+        return
+
+    from rich.markup import escape
+
+    _ensure_utf8_stdout()
+    console, banner = _banner()
+    # Banner art and the decorative community blocks are only shown on a
+    # terminal; redirected output (log files, pipes) gets the plain details.
+    decorate = console.is_terminal
+
+    # Collect everything below the panel as markup lines and print them at once.
+    # Dynamic values are escaped so brackets in IDs or URLs are not read as tags.
+    lines: list[str] = []
+
+    # Version
+    lines.append(_VERSION_LINE)
+    lines.append("")
+
+    # Server information
     if host and port:
-        console.print(Text("🚀 Bindu Server 🚀", style="bold magenta"), highlight=False)
-        console.print(
-            Text(f"Local Server: http://{host}:{port}", style="green"), highlight=False
-        )
+        local_url = escape(f"http://{host}:{port}")
+        if decorate:
+            lines.append("[bold magenta]🚀 Bindu Server 🚀[/bold magenta]")
+        lines.append(f"[green]Local Server: {local_url}[/green]")
 
         # Display tunnel URL prominently if available
         if tunnel_url:
-            console.print(
-                Text(f"🌐 Public URL: {tunnel_url}", style="bold bright_green"),
-                highlight=False,
+            lines.append(
+                f"[bold bright_green]🌐 Public URL: {escape(tunnel_url)}[/bold bright_green]"
             )
 
-        console.print()
+        lines.append("")
 
     if agent_id:
-        console.print(Text(f"Agent ID: {agent_id}", style="cyan"), highlight=False)
+        lines.append(f"[cyan]Agent ID: {escape(agent_id)}[/cyan]")
 
     if agent_did:
-        console.print(Text(f"Agent DID: {agent_did}", style="cyan"), highlight=False)
+        lines.append(f"[cyan]Agent DID: {escape(agent_did)}[/cyan]")
 
     if agent_id or agent_did:
-        console.print()
+        lines.append("")
 
-    # Print protocol endpoints
+    # Protocol endpoints
     if host and port:
         # Use tunnel URL if available, otherwise local URL
-        base_url = tunnel_url if tunnel_url else f"http://{host}:{port}"
+        base_url = escape(tunnel_url if tunnel_url else f"http://{host}:{port}")
 
-        console.print(Text("Protocol Endpoints:", style="bold white"), highlight=False)
-        console.print(
-            Text(f"  - Agent Endpoint: {base_url}/", style="white"), highlight=False
-        )
-        console.print(
-            Text(f"  - Agent Card: {base_url}/.well-known/agent.json", style="white"),
-            highlight=False,
-        )
-        console.print(
-            Text(f"  - DID Resolution: {base_url}/did/resolve", style="white"),
-            highlight=False,
+        lines.append("[bold white]Protocol Endpoints:[/bold white]")
+        lines.append(
+            f"[white]  - Agent Endpoint: {base_url}/\n"
+            f"  - Agent Card: {base_url}/.well-known/agent.json\n"
+            f"  - DID Resolution: {base_url}/did/resolve[/white]"
         )
-        console.print()
-
-    # Print community and documentation
-    console.print(
-        Text("⭐️⭐️⭐️ Support Open Source ⭐️⭐️⭐️", style="bold yellow"),
-        highlight=False,
-    )
-    console.print(
-        Text("⭐️⭐️⭐️ Star on GitHub! ⭐️⭐️⭐️", style="bold yellow"), highlight=False
-    )
-    console.print(
-        Text("https://github.com/getbindu/Bindu", style="cyan underline"),
-        highlight=False,
-    )
-    console.print()
-
-    console.print(Text("Join our Community 🤝", style="bold green"), highlight=False)
-    console.print(
-        Text("https://discord.gg/3w5zuYUuwt", style="cyan underline"), highlight=False
-    )
-    console.print()
+        lines.append("")
 
-    console.print(Text("Documentation 🌻", style="bold blue"), highlight=False)
-    console.print(
-        Text("https://docs.getbindu.com", style="cyan underline"), highlight=False
-    )
-    console.print()
+    # Community and documentation
+    if decorate:
+        lines.append(_COMMUNITY_BLOCK)
 
-    # Print token retrieval command if credentials are available
+    # Token retrieval command if credentials are available
     if client_id and client_secret:
-        console.print(
-            Text("🔑 Get Access Token:", style="bold yellow"), highlight=False
-        )
-        curl_cmd = (
-            f"curl -X POST https://hydra.getbindu.com/oauth2/token \\\n"
-            f'  -H "Content-Type: application/x-www-form-urlencoded" \\\n'
-            f'  -d "grant_type=client_credentials" \\\n'
-            f'  -d "client_id={client_id}" \\\n'
-            f'  -d "client_secret=<YOUR_CLIENT_SECRET>" \\\n'
-            f'  -d "scope=openid offline agent:read agent:write"'
-        )
-        console.print(Text(curl_cmd, style="dim"), highlight=False)
-        console.print(
-            Text(
-                "📁 Find your client_secret in: .bindu/oauth_credentials.json",
-                style="italic cyan",
-            ),
-            highlight=False,
+        lines.append("[bold yellow]🔑 Get Access Token:[/bold yellow]")
+        curl_cmd = _CURL_TEMPLATE.format_map({"client_id": escape(client_id)})
+        lines.append(f"[dim]{curl_cmd}[/dim]")
+        lines.append(
+            "[italic cyan]📁 Find your client_secret in: "
+            ".bindu/oauth_credentials.json[/italic cyan]"
         )
-        console.print()
+        lines.append("")
+
+    # Render everything into a capture buffer and hand it to stdout in one write
+    with console.capture() as capture:
+        if decorate:
+            console.print()
+            console.print(banner)
+            console.print()
+        console.print("\n".join(lines), emoji=False)
+    sys.stdout.write(capture.get())
+    sys.stdout.flush()
@@ -8,6 +8,7 @@ import os
 from pathlib import Path
 from typing import Dict
 
+from bindu.utils.config_loader import refresh_env_cache
 from bindu.utils.logging import get_logger
 
 logger = get_logger("bindu.utils.env_loader")
@@ -62,6 +63,9 @@ def apply_env_vars(env_vars: Dict[str, str], override_existing: bool = False) ->
             os.environ[key] = value
             applied_count += 1
 
+    if applied_count:
+        refresh_env_cache()
+
     logger.debug(f"Applied {applied_count}/{len(env_vars)} environment variables")
 
 
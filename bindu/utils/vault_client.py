@@ -293,17 +293,21 @@ class VaultClient:
 async def restore_did_keys_from_vault(
     agent_id: str,
     key_dir: Path,
+    vault: Optional[VaultClient] = None,
 ) -> Optional[str]:
     """Restore DID keys from Vault to local filesystem.
 
     Args:
         agent_id: Unique agent identifier
         key_dir: Directory to restore keys to
+        vault: Optional client to reuse; left open for the caller to close
 
     Returns:
         DID if successful, None otherwise
     """
-    vault = VaultClient()
+    owns_client = vault is None
+    if vault is None:
+        vault = VaultClient()
     try:
         keys = await vault.get_did_keys(agent_id)
 
@@ -332,13 +336,15 @@ async def restore_did_keys_from_vault(
         logger.error(f"Failed to restore DID keys from Vault: {e}")
         return None
     finally:
-        await vault.close()
+        if owns_client:
+            await vault.close()
 
 
 async def backup_did_keys_to_vault(
     agent_id: str,
     key_dir: Path,
     did: str,
+    vault: Optional[VaultClient] = None,
 ) -> bool:
     """Backup DID keys from local filesystem to Vault.
 
@@ -346,11 +352,14 @@ async def backup_did_keys_to_vault(
         agent_id: Unique agent identifier
         key_dir: Directory containing keys
         did: Agent's DID
+        vault: Optional client to reuse; left open for the caller to close
 
     Returns:
         True if successful, False otherwise
     """
-    vault = VaultClient()
+    owns_client = vault is None
+    if vault is None:
+        vault = VaultClient()
     try:
         # Read private key using filename from settings
         private_key_path = key_dir / app_settings.did.private_key_filename
@@ -382,4 +391,5 @@ async def backup_did_keys_to_vault(
         logger.error(f"Failed to backup DID keys to Vault: {e}")
         return False
     finally:
-        await vault.close()
+        if owns_client:
+            await vault.close()
@@ -76,6 +76,37 @@ class MessageConverter:
 
         return [Message(**message_data)]
 
+    @staticmethod
+    def to_error_message(
+        text: str,
+        task_id: Optional[Union[str, UUID]] = None,
+        context_id: Optional[Union[str, UUID]] = None,
+    ) -> list[ProtocolMessage]:
+        """Build the protocol message for a single error string.
+
+        Same output as to_protocol_messages(text, task_id, context_id), but
+        skips the result-type dispatch since the input is always one string.
+
+        Args:
+            text: Error text
+            task_id: Optional task ID
+            context_id: Optional context ID
+
+        Returns:
+            List containing one protocol message
+        """
+        message = Message(
+            role="assistant",
+            parts=[TextPart(kind="text", text=text)],
+            kind="message",
+            message_id=uuid4(),
+        )
+        if task_id:
+            message["task_id"] = task_id
+        if context_id:
+            message["context_id"] = context_id
+        return [message]
+
     @staticmethod
     def _extract_text_content(message: Message) -> str:
         """Extract text content from protocol message."""
@@ -51,6 +51,9 @@ config = {
     "skills": ["skills/weather-research-skill"],
 }
 
+# Sentinel for attributes missing from the agent result
+_MISSING = object()
+
 # Message handler function
 def handler(messages: list[dict[str, str]]):
     """
@@ -70,12 +73,13 @@ def handler(messages: list[dict[str, str]]):
         result = agent.run(input=latest_message)
 
         # Format the response to be cleaner
-        if hasattr(result, 'content'):
-            return result.content
-        elif hasattr(result, 'response'):
-            return result.response
-        else:
-            return str(result)
+        content = getattr(result, 'content', _MISSING)
+        if content is not _MISSING:
+            return content
+        response = getattr(result, 'response', _MISSING)
+        if response is not _MISSING:
+            return response
+        return str(result)
 
     return "Please provide a location for weather information."
 
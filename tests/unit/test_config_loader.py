@@ -0,0 +1,261 @@
+"""Unit tests for environment-based configuration loading."""
+
+import pytest
+
+from bindu.utils import config_loader
+from bindu.utils.config_loader import (
+    create_storage_config_from_env,
+    load_config_from_env,
+    refresh_env_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_env(monkeypatch):
+    """Start every test from an environment without config variables."""
+    for name in (
+        "STORAGE_TYPE",
+        "DATABASE_URL",
+        "SCHEDULER_TYPE",
+        "REDIS_URL",
+        "SENTRY_ENABLED",
+        "TELEMETRY_ENABLED",
+        "OLTP_HEADERS",
+        "AUTH__ENABLED",
+        "AUTH__PROVIDER",
+        "VAULT__ENABLED",
+        "VAULT__URL",
+        "VAULT_ADDR",
+        "VAULT__TOKEN",
+        "VAULT_TOKEN",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    refresh_env_cache()
+    yield
+    refresh_env_cache()
+
+
+def test_load_config_from_env_sees_env_set_after_import(monkeypatch):
+    """Test each load pass re-reads the environment."""
+    monkeypatch.setenv("STORAGE_TYPE", "postgres")
+    monkeypatch.setenv("DATABASE_URL", "postgresql://db/bindu")
+
+    config = load_config_from_env({})
+
+    assert config["storage"] == {
+        "type": "postgres",
+        "postgres_url": "postgresql://db/bindu",
+    }
+
+
+def test_helpers_read_cached_snapshot(monkeypatch):
+    """Test helpers use the snapshot until it is refreshed."""
+    monkeypatch.setenv("STORAGE_TYPE", "memory")
+    refresh_env_cache()
+    monkeypatch.setenv("STORAGE_TYPE", "postgres")
+
+    assert create_storage_config_from_env({}).type == "memory"
+
+    refresh_env_cache()
+    assert create_storage_config_from_env({}).type == "postgres"
+
+
+def test_oltp_headers_parsed_once_and_copied(monkeypatch):
+    """Test OLTP_HEADERS is parsed once and each caller gets its own dict."""
+    monkeypatch.setenv("OLTP_HEADERS", '{"Authorization": "Basic abc"}')
+    config_loader._parsed_oltp_headers.cache_clear()
+
+    first = load_config_from_env({"telemetry": True})
+    first["oltp_headers"]["Authorization"] = "changed"
+    second = load_config_from_env({"telemetry": True})
+
+    assert second["oltp_headers"] == {"Authorization": "Basic abc"}
+    assert config_loader._parsed_oltp_headers.cache_info().hits == 1
+
+
+def test_invalid_oltp_headers_raises(monkeypatch):
+    """Test malformed OLTP_HEADERS is reported as a ValueError."""
+    monkeypatch.setenv("OLTP_HEADERS", "not-json")
+
+    with pytest.raises(ValueError, match="Invalid OLTP_HEADERS"):
+        load_config_from_env({"telemetry": True})
+
+
+@pytest.mark.parametrize(
+    ("value", "default", "expected"),
+    [
+        (None, False, False),
+        (None, True, True),
+        ("TRUE", False, True),
+        ("1", False, True),
+        ("Yes", False, True),
+        ("false", True, False),
+        ("", True, False),
+        ("on", False, False),
+    ],
+)
+def test_bool_env(monkeypatch, value, default, expected):
+    """Test boolean env parsing accepts only true/1/yes."""
+    if value is None:
+        monkeypatch.delenv("TUNNEL_ENABLED", raising=False)
+    else:
+        monkeypatch.setenv("TUNNEL_ENABLED", value)
+    refresh_env_cache()
+
+    assert config_loader._bool_env("TUNNEL_ENABLED", default) is expected
+
+
+@pytest.mark.parametrize(
+    ("type_env", "backend", "message"),
+    [
+        ("STORAGE_TYPE", "postgres", "DATABASE_URL environment variable is required"),
+        ("SCHEDULER_TYPE", "redis", "REDIS_URL environment variable is required"),
+    ],
+)
+def test_backend_url_required(monkeypatch, type_env, backend, message):
+    """Test a non-memory backend without its URL variable is rejected."""
+    monkeypatch.setenv(type_env, backend)
+
+    with pytest.raises(ValueError, match=message):
+        load_config_from_env({})
+
+
+def test_backends_default_to_memory():
+    """Test storage and scheduler default to memory and keep user sections."""
+    config = load_config_from_env({"scheduler": {"type": "redis"}})
+
+    assert config["storage"] == {"type": "memory"}
+    assert config["scheduler"] == {"type": "redis"}
+
+
+def test_hydra_settings_loaded_from_env(monkeypatch):
+    """Test Hydra auth settings are read and coerced from the environment."""
+    monkeypatch.setenv("AUTH__ENABLED", "true")
+    monkeypatch.setenv("AUTH__PROVIDER", "Hydra")
+    monkeypatch.setenv("HYDRA__ADMIN_URL", "http://hydra:4445")
+    monkeypatch.setenv("HYDRA__TIMEOUT", "15")
+    monkeypatch.setenv("HYDRA__VERIFY_SSL", "false")
+    monkeypatch.delenv("HYDRA__AUTO_REGISTER_AGENTS", raising=False)
+    monkeypatch.delenv("HYDRA__PUBLIC_URL", raising=False)
+
+    auth = load_config_from_env({})["auth"]
+
+    assert auth["provider"] == "hydra"
+    assert auth["admin_url"] == "http://hydra:4445"
+    assert auth["timeout"] == 15
+    assert auth["verify_ssl"] is False
+    assert auth["auto_register_agents"] is True
+    assert "public_url" not in auth
+
+
+def test_load_config_from_env_returns_input_when_nothing_added():
+    """Test a fully specified config is returned without copying."""
+    config = {
+        "storage": {"type": "memory"},
+        "scheduler": {"type": "memory"},
+        "telemetry": False,
+    }
+
+    assert load_config_from_env(config) is config
+
+
+def test_load_config_from_env_does_not_mutate_input():
+    """Test env fallbacks are added to a new dict."""
+    config = {"name": "agent"}
+
+    enriched = load_config_from_env(config)
+
+    assert config == {"name": "agent"}
+    assert enriched["name"] == "agent"
+    assert enriched["storage"] == {"type": "memory"}
+
+
+def test_tunnel_config_defaults_and_overrides(monkeypatch):
+    """Test tunnel configs keep TunnelConfig defaults for unset fields."""
+    from bindu.utils.config_loader import create_tunnel_config_from_env
+
+    from_user = create_tunnel_config_from_env({"tunnel": {"subdomain": "demo"}})
+    assert from_user.subdomain == "demo"
+    assert from_user.enabled is False
+    assert from_user.server_address == "142.132.241.44:7000"
+    assert from_user.local_host == "127.0.0.1"
+
+    monkeypatch.setenv("TUNNEL_ENABLED", "true")
+    monkeypatch.setenv("TUNNEL_PROTOCOL", "https")
+    monkeypatch.delenv("TUNNEL_DOMAIN", raising=False)
+    refresh_env_cache()
+
+    from_env = create_tunnel_config_from_env({})
+    assert from_env.enabled is True
+    assert from_env.protocol == "https"
+    assert from_env.tunnel_domain == "tunnel.getbindu.com"
+
+
+def test_webhook_env_ignored_without_push_notifications(monkeypatch):
+    """Test webhook env vars only apply when push notifications are enabled."""
+    monkeypatch.setenv("WEBHOOK_URL", "https://hooks.example.com")
+
+    assert "global_webhook_url" not in load_config_from_env({"capabilities": None})
+
+    enriched = load_config_from_env({"capabilities": {"push_notifications": True}})
+    assert enriched["global_webhook_url"] == "https://hooks.example.com"
+
+
+def test_update_auth_settings_applies_only_given_hydra_keys(monkeypatch):
+    """Test Hydra settings absent from the auth config keep their values."""
+    from bindu.settings import app_settings
+    from bindu.utils.config_loader import update_auth_settings
+
+    monkeypatch.setattr(app_settings.auth, "enabled", False)
+    monkeypatch.setattr(app_settings.hydra, "enabled", False)
+    monkeypatch.setattr(app_settings.hydra, "timeout", 10)
+    monkeypatch.setattr(app_settings.hydra, "admin_url", "http://old:4445")
+
+    update_auth_settings(
+        {"enabled": True, "provider": "hydra", "admin_url": "http://hydra:4445"}
+    )
+
+    assert app_settings.auth.enabled is True
+    assert app_settings.hydra.enabled is True
+    assert app_settings.hydra.admin_url == "http://hydra:4445"
+    assert app_settings.hydra.timeout == 10
+
+
+def test_update_vault_settings(monkeypatch):
+    """Test Vault settings are overridden only for keys in the config."""
+    from bindu.settings import app_settings
+    from bindu.utils.config_loader import update_vault_settings
+
+    monkeypatch.setattr(app_settings.vault, "enabled", False)
+    monkeypatch.setattr(app_settings.vault, "url", "http://vault:8200")
+    monkeypatch.setattr(app_settings.vault, "token", "old-token")
+
+    update_vault_settings({"enabled": True, "token": "new-token"})
+
+    assert app_settings.vault.enabled is True
+    assert app_settings.vault.url == "http://vault:8200"
+    assert app_settings.vault.token == "new-token"
+
+
+def test_invalid_hydra_integer_is_ignored(monkeypatch):
+    """Test a malformed Hydra integer is skipped instead of failing startup."""
+    monkeypatch.setenv("AUTH__ENABLED", "true")
+    monkeypatch.setenv("AUTH__PROVIDER", "hydra")
+    monkeypatch.setenv("HYDRA__TIMEOUT", "ten")
+    monkeypatch.setenv("HYDRA__MAX_RETRIES", "0")
+
+    auth = load_config_from_env({})["auth"]
+
+    assert "timeout" not in auth
+    assert auth["max_retries"] == 0
+
+
+def test_vault_env_fallback_names(monkeypatch):
+    """Test Vault settings fall back to the standard VAULT_* variable names."""
+    monkeypatch.setenv("VAULT__URL", "")
+    monkeypatch.setenv("VAULT_ADDR", "http://vault:8200")
+    monkeypatch.setenv("VAULT_TOKEN", "s.token")
+
+    vault = load_config_from_env({})["vault"]
+
+    assert vault == {"enabled": False, "url": "http://vault:8200", "token": "s.token"}
@@ -95,3 +95,185 @@ def test_execution_cost_rejects_invalid_type():
         ConfigValidator.validate_and_process(config)
 
     assert "execution_cost" in str(exc.value)
+
+
+def test_load_and_validate_config_picks_up_file_changes(tmp_path):
+    import json
+
+    from bindu.penguin import config_validator
+
+    config_file = tmp_path / "agent_config.json"
+    config = {
+        "author": "test@example.com",
+        "name": "agent",
+        "deployment": {"url": "http://localhost:3773"},
+    }
+    config_file.write_text(json.dumps(config))
+
+    first = config_validator.load_and_validate_config(str(config_file))
+    first["name"] = "mutated"
+    second = config_validator.load_and_validate_config(str(config_file))
+    assert second["name"] == "agent"
+
+    config["name"] = "renamed-agent"
+    config_file.write_text(json.dumps(config))
+
+    third = config_validator.load_and_validate_config(str(config_file))
+    assert third["name"] == "renamed-agent"
+
+
+@pytest.mark.parametrize(
+    ("field", "value", "message"),
+    [
+        ("description", 5, "Field 'description' must be a string"),
+        ("telemetry", None, "Field 'telemetry' must be a boolean"),
+        (
+            "num_history_sessions",
+            -1,
+            "Field 'num_history_sessions' must be a non-negative integer",
+        ),
+        ("kind", "swarm", "Field 'kind' must be one of: agent, team, workflow"),
+        ("execution_cost", [], "Field 'execution_cost' list cannot be empty"),
+    ],
+)
+def test_field_type_errors(field, value, message):
+    config = {
+        "author": "test@example.com",
+        "name": "agent",
+        "deployment": {"url": "http://localhost:3773"},
+        field: value,
+    }
+
+    with pytest.raises(ValueError) as exc:
+        ConfigValidator.validate_and_process(config)
+
+    assert str(exc.value) == message
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [
+        ("num_history_sessions", True),
+        ("debug_level", True),
+        ("execution_cost", {1: "x"}),
+        ("execution_cost", [{1: "x"}]),
+    ],
+)
+def test_field_types_accept_lenient_values(field, value):
+    config = {
+        "author": "test@example.com",
+        "name": "agent",
+        "deployment": {"url": "http://localhost:3773"},
+        field: value,
+    }
+
+    assert ConfigValidator.validate_and_process(config)[field] == value
+
+
+@pytest.mark.parametrize(
+    ("auth", "message"),
+    [
+        ({"admin_url": "ftp://hydra"}, "Invalid Hydra admin_url: 'ftp://hydra'"),
+        ({"admin_url": 4445}, "Invalid Hydra admin_url: '4445'"),
+    ],
+)
+def test_hydra_auth_config_errors(auth, message):
+    config = {
+        "author": "test@example.com",
+        "name": "agent",
+        "deployment": {"url": "http://localhost:3773"},
+        "auth": {"enabled": True, "provider": "hydra", **auth},
+    }
+
+    with pytest.raises(ValueError) as exc:
+        ConfigValidator.validate_and_process(config)
+
+    assert message in str(exc.value)
+
+
+def test_oltp_env_references_are_resolved(monkeypatch):
+    monkeypatch.setenv("TEST_OLTP_ENDPOINT", "http://localhost:4318/v1/traces")
+    monkeypatch.setenv("TEST_OLTP_VERBOSE", "true")
+    monkeypatch.delenv("TEST_OLTP_SERVICE", raising=False)
+    config = {
+        "author": "test@example.com",
+        "name": "agent",
+        "deployment": {"url": "http://localhost:3773"},
+        "oltp_endpoint": "env:TEST_OLTP_ENDPOINT",
+        "oltp_service_name": "env:TEST_OLTP_SERVICE",
+        "oltp_verbose_logging": "env:TEST_OLTP_VERBOSE",
+    }
+
+    validated = ConfigValidator.validate_and_process(config)
+
+    assert validated["oltp_endpoint"] == "http://localhost:4318/v1/traces"
+    assert validated["oltp_service_name"] is None
+    assert validated["oltp_verbose_logging"] is True
+
+
+def test_trusted_validated_config_skips_revalidation(monkeypatch):
+    from bindu.penguin import config_validator
+
+    config = {
+        "author": "test@example.com",
+        "name": "agent",
+        "deployment": {"url": "http://localhost:3773"},
+    }
+    validated = ConfigValidator.validate_and_process(config)
+
+    monkeypatch.setattr(config_validator, "_TRUST_VALIDATED", True)
+    assert ConfigValidator.validate_and_process(validated) is validated
+    # Plain dicts are always validated
+    assert ConfigValidator.validate_and_process(dict(validated)) is not validated
+
+    monkeypatch.setattr(config_validator, "_TRUST_VALIDATED", False)
+    assert ConfigValidator.validate_and_process(validated) is not validated
+
+
+def test_load_and_validate_config_resolves_env_on_each_load(tmp_path, monkeypatch):
+    import json
+
+    from bindu.penguin import config_validator
+
+    config_file = tmp_path / "agent_config.json"
+    config_file.write_text(
+        json.dumps(
+            {
+                "author": "test@example.com",
+                "name": "agent",
+                "deployment": {"url": "http://localhost:3773"},
+                "telemetry": True,
+                "oltp_endpoint": "env:MY_EP",
+            }
+        )
+    )
+
+    monkeypatch.setenv("MY_EP", "http://one")
+    first = config_validator.load_and_validate_config(str(config_file))
+    monkeypatch.setenv("MY_EP", "http://two")
+    second = config_validator.load_and_validate_config(str(config_file))
+
+    assert first["oltp_endpoint"] == "http://one"
+    assert second["oltp_endpoint"] == "http://two"
+
+
+def test_load_and_validate_config_via_mmap(tmp_path, monkeypatch):
+    import json
+
+    from bindu.penguin import config_validator
+
+    monkeypatch.setattr(config_validator, "_MMAP_THRESHOLD", 0)
+    config_file = tmp_path / "agent_config.json"
+    config_file.write_text(
+        json.dumps(
+            {
+                "author": "test@example.com",
+                "name": "agent",
+                "deployment": {"url": "http://localhost:3773"},
+            }
+        )
+    )
+
+    validated = config_validator.load_and_validate_config(str(config_file))
+
+    assert validated["name"] == "agent"
@@ -2,7 +2,7 @@
 
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from bindu.penguin.did_setup import initialize_did_extension
 
 
@@ -61,3 +61,76 @@ class TestInitializeDIDExtension:
         call_kwargs = mock_did_class.call_args[1]
         assert call_kwargs["recreate_keys"] is False
         assert call_kwargs["key_password"] is None
+
+    @patch("bindu.penguin.did_setup.DIDAgentExtension")
+    def test_initialize_did_extension_vault_shares_one_client(
+        self, mock_did_class, tmp_path
+    ):
+        """Test Vault restore and backup reuse a single client."""
+        mock_extension = MagicMock()
+        mock_extension.did = "did:key:test123"
+        mock_did_class.return_value = mock_extension
+        mock_vault = AsyncMock()
+
+        with (
+            patch("bindu.penguin.did_setup.app_settings.vault.enabled", True),
+            patch(
+                "bindu.utils.vault_client.VaultClient", return_value=mock_vault
+            ) as mock_vault_class,
+            patch(
+                "bindu.utils.vault_client.restore_did_keys_from_vault",
+                new=AsyncMock(return_value=None),
+            ) as mock_restore,
+            patch(
+                "bindu.utils.vault_client.backup_did_keys_to_vault",
+                new=AsyncMock(return_value=True),
+            ) as mock_backup,
+        ):
+            result = initialize_did_extension(
+                agent_id="agent-123",
+                author="test@example.com",
+                agent_name="Test Agent",
+                key_dir=tmp_path,
+            )
+
+        assert result is mock_extension
+        mock_vault_class.assert_called_once()
+        assert mock_restore.await_args.kwargs["vault"] is mock_vault
+        assert mock_backup.await_args.kwargs["vault"] is mock_vault
+        mock_vault.close.assert_awaited_once()
+
+    @patch("bindu.penguin.did_setup.DIDAgentExtension")
+    def test_initialize_did_extension_vault_skips_restore_with_local_keys(
+        self, mock_did_class, tmp_path
+    ):
+        """Test Vault restore is skipped when both key files exist locally."""
+        from bindu.settings import app_settings
+
+        mock_extension = MagicMock()
+        mock_extension.did = "did:key:test123"
+        mock_did_class.return_value = mock_extension
+        pki_dir = tmp_path / app_settings.did.pki_dir
+        pki_dir.mkdir()
+        (pki_dir / app_settings.did.private_key_filename).write_text("private")
+        (pki_dir / app_settings.did.public_key_filename).write_text("public")
+
+        with (
+            patch("bindu.penguin.did_setup.app_settings.vault.enabled", True),
+            patch("bindu.utils.vault_client.VaultClient", return_value=AsyncMock()),
+            patch(
+                "bindu.utils.vault_client.restore_did_keys_from_vault",
+                new=AsyncMock(return_value=None),
+            ) as mock_restore,
+            patch(
+                "bindu.utils.vault_client.backup_did_keys_to_vault",
+                new=AsyncMock(return_value=True),
+            ),
+        ):
+            initialize_did_extension(
+                agent_id="agent-123",
+                author="test@example.com",
+                agent_name="Test Agent",
+                key_dir=tmp_path,
+            )
+
+        mock_restore.assert_not_awaited()
@@ -0,0 +1,48 @@
+"""Unit tests for the server startup display."""
+
+from bindu.utils.display import prepare_server_display
+
+
+def test_prepare_server_display_plain_when_not_a_terminal(capsys, monkeypatch):
+    """Redirected output should carry the details without banner decoration."""
+    monkeypatch.delenv("FORCE_COLOR", raising=False)
+    monkeypatch.delenv("TTY_COMPATIBLE", raising=False)
+
+    prepare_server_display(
+        host="localhost",
+        port=3773,
+        agent_id="agent-[1]",
+        agent_did="did:bindu:tester:agent",
+    )
+
+    out = capsys.readouterr().out
+    assert "Night Sky" not in out
+    assert "Support Open Source" not in out
+    assert "Local Server: http://localhost:3773" in out
+    assert "Agent ID: agent-[1]" in out
+    assert "Agent DID: did:bindu:tester:agent" in out
+    assert "  - Agent Card: http://localhost:3773/.well-known/agent.json" in out
+
+
+def test_prepare_server_display_includes_token_command(capsys, monkeypatch):
+    """The curl command should appear when OAuth credentials are available."""
+    monkeypatch.delenv("FORCE_COLOR", raising=False)
+    monkeypatch.delenv("TTY_COMPATIBLE", raising=False)
+
+    prepare_server_display(client_id="cid-123", client_secret="s3cr3t-value")
+
+    out = capsys.readouterr().out
+    assert '-d "client_id=cid-123"' in out
+    assert "s3cr3t-value" not in out
+
+
+def test_prepare_server_display_quiet_prints_single_line(capsys, monkeypatch):
+    """BINDU_QUIET should replace the banner with one plain line."""
+    monkeypatch.setenv("BINDU_QUIET", "1")
+
+    prepare_server_display(host="localhost", port=3773, agent_id="agent-1")
+
+    out = capsys.readouterr().out
+    assert out.endswith(" on localhost:3773\n")
+    assert out.startswith("Bindu ")
+    assert out.count("\n") == 1
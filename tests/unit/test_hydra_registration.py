@@ -4,13 +4,16 @@ import json
 import pytest
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from bindu.auth.hydra import registration as registration_module
 from bindu.auth.hydra.registration import (
     save_agent_credentials,
     load_agent_credentials,
     AgentCredentials,
+    AgentRegistration,
     register_agent_in_hydra,
+    register_agents_in_hydra,
 )
 
 
@@ -104,6 +107,45 @@ class TestSaveAgentCredentials:
 
             assert "did:key:test" in saved_data
 
+    def test_save_credentials_atomic_replace(self):
+        """Test that saving leaves no temp file and restricts permissions."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            credentials_dir = Path(tmpdir)
+
+            credentials = AgentCredentials(
+                agent_id="test-agent",
+                client_id="did:key:test",
+                client_secret="test-secret",  # pragma: allowlist secret
+                created_at="2026-01-01T00:00:00Z",
+                scopes=["agent:read"],
+            )
+            save_agent_credentials(credentials, credentials_dir)
+
+            creds_file = credentials_dir / "oauth_credentials.json"
+            assert not (credentials_dir / "oauth_credentials.json.tmp").exists()
+            assert creds_file.stat().st_mode & 0o777 == 0o600
+
+    def test_save_credentials_unchanged_skips_write(self):
+        """Test that re-saving identical credentials does not rewrite the file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            credentials_dir = Path(tmpdir)
+
+            credentials = AgentCredentials(
+                agent_id="test-agent",
+                client_id="did:key:test",
+                client_secret="test-secret",  # pragma: allowlist secret
+                created_at="2026-01-01T00:00:00Z",
+                scopes=["agent:read"],
+            )
+            save_agent_credentials(credentials, credentials_dir)
+
+            with patch(
+                "bindu.auth.hydra.registration._write_credentials_file"
+            ) as mock_write:
+                save_agent_credentials(credentials, credentials_dir)
+
+            mock_write.assert_not_called()
+
 
 class TestLoadAgentCredentials:
     """Test loading agent credentials."""
@@ -152,6 +194,48 @@ class TestLoadAgentCredentials:
 
             assert loaded is None
 
+    def test_load_credentials_via_mmap(self):
+        """Test loading a credentials file above the mmap threshold."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            credentials_dir = Path(tmpdir)
+
+            credentials = AgentCredentials(
+                agent_id="test-agent",
+                client_id="did:key:test",
+                client_secret="test-secret",  # pragma: allowlist secret
+                created_at="2026-01-01T00:00:00Z",
+                scopes=["agent:read"],
+            )
+            save_agent_credentials(credentials, credentials_dir)
+            registration_module._CREDS_CACHE.clear()
+
+            with patch("bindu.auth.hydra.registration._MMAP_THRESHOLD", 0):
+                loaded = load_agent_credentials("did:key:test", credentials_dir)
+
+            assert loaded == credentials
+
+    def test_load_credentials_sees_external_changes(self):
+        """Test that the in-process cache is invalidated when the file changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            credentials_dir = Path(tmpdir)
+
+            credentials = AgentCredentials(
+                agent_id="test-agent",
+                client_id="did:key:test",
+                client_secret="test-secret",  # pragma: allowlist secret
+                created_at="2026-01-01T00:00:00Z",
+                scopes=["agent:read"],
+            )
+            save_agent_credentials(credentials, credentials_dir)
+            assert load_agent_credentials("did:key:test", credentials_dir) is not None
+
+            # Rewrite the file behind the cache's back
+            creds_file = credentials_dir / "oauth_credentials.json"
+            with open(creds_file, "w") as f:
+                json.dump({"did:key:other": credentials.to_dict()}, f)
+
+            assert load_agent_credentials("did:key:test", credentials_dir) is None
+
     def test_load_credentials_no_file(self):
         """Test loading when credentials file doesn't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -257,3 +341,116 @@ class TestRegisterAgentInHydra:
             )
 
             assert result is None
+
+    @pytest.mark.asyncio
+    async def test_batch_registration_single_flush(self):
+        """Test that batch registration writes the credentials file once."""
+        hydra = AsyncMock()
+        hydra.get_oauth_client.return_value = None
+
+        registrations = [
+            AgentRegistration(
+                agent_id=f"agent-{i}",
+                agent_name=f"Agent {i}",
+                agent_url="http://localhost:3773",
+                did=f"did:key:agent{i}",
+            )
+            for i in range(3)
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            credentials_dir = Path(tmpdir)
+
+            with (
+                patch(
+                    "bindu.auth.hydra.registration._create_hydra_client",
+                    MagicMock(return_value=hydra),
+                ),
+                patch(
+                    "bindu.auth.hydra.registration._write_credentials_file",
+                    wraps=registration_module._write_credentials_file,
+                ) as mock_write,
+            ):
+                results = await register_agents_in_hydra(registrations, credentials_dir)
+
+            assert [r.client_id for r in results] == [
+                "did:key:agent0",
+                "did:key:agent1",
+                "did:key:agent2",
+            ]
+            assert hydra.create_oauth_client.await_count == 3
+            hydra.close.assert_awaited_once()
+            mock_write.assert_called_once()
+
+            with open(credentials_dir / "oauth_credentials.json", "r") as f:
+                saved_data = json.load(f)
+            assert len(saved_data) == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_registration_shares_and_closes_vault_client(self):
+        """Test that one Vault client serves the batch and is closed after it."""
+        hydra = AsyncMock()
+        hydra.get_oauth_client.return_value = None
+        vault = AsyncMock()
+        vault.get_hydra_credentials.return_value = None
+        vault.store_hydra_credentials.return_value = True
+        vault_cls = MagicMock(return_value=vault)
+
+        registrations = [
+            AgentRegistration(
+                agent_id=f"agent-{i}",
+                agent_name=f"Agent {i}",
+                agent_url="http://localhost:3773",
+                did=f"did:key:agent{i}",
+            )
+            for i in range(2)
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with (
+                patch(
+                    "bindu.auth.hydra.registration._create_hydra_client",
+                    MagicMock(return_value=hydra),
+                ),
+                patch("bindu.auth.hydra.registration.VaultClient", vault_cls),
+                patch.object(registration_module.app_settings.vault, "enabled", True),
+            ):
+                results = await register_agents_in_hydra(registrations, Path(tmpdir))
+
+        assert all(r is not None for r in results)
+        vault_cls.assert_called_once_with()
+        assert vault.get_hydra_credentials.await_count == 2
+        assert vault.store_hydra_credentials.await_count == 2
+        vault.close.assert_awaited_once()
+        hydra.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_registration_client_construction_failure(self):
+        """Test that a client constructor error is handled and the other client closed."""
+        hydra = AsyncMock()
+        registrations = [
+            AgentRegistration(
+                agent_id="agent-0",
+                agent_name="Agent 0",
+                agent_url="http://localhost:3773",
+                did="did:key:agent0",
+            )
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with (
+                patch(
+                    "bindu.auth.hydra.registration._create_hydra_client",
+                    MagicMock(return_value=hydra),
+                ),
+                patch(
+                    "bindu.auth.hydra.registration.VaultClient",
+                    MagicMock(side_effect=ValueError("bad vault config")),
+                ),
+                patch.object(registration_module.app_settings.vault, "enabled", True),
+            ):
+                results = await register_agents_in_hydra(registrations, Path(tmpdir))
+
+        assert results == [None]
+        hydra.close.assert_awaited_once()
+        hydra.get_oauth_client.assert_not_called()
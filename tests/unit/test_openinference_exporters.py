@@ -0,0 +1,219 @@
+"""Unit tests for the OTLP exporter wrappers in bindu.observability.openinference."""
+
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from bindu.observability import openinference
+from bindu.observability.openinference import (
+    _ConcurrentSpanExporter,
+    _FanoutSpanExporter,
+    _concurrent_batch_processor_cls,
+)
+
+
+@pytest.fixture(scope="module")
+def otel():
+    """Swap the conftest OpenTelemetry stubs for the real API and SDK."""
+    stubs = {
+        name: module
+        for name, module in sys.modules.items()
+        if name == "opentelemetry" or name.startswith("opentelemetry.")
+    }
+    for name in stubs:
+        del sys.modules[name]
+    try:
+        from opentelemetry import context
+        from opentelemetry.context import _SUPPRESS_INSTRUMENTATION_KEY
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        yield SimpleNamespace(
+            context=context,
+            suppress_key=_SUPPRESS_INSTRUMENTATION_KEY,
+            TracerProvider=TracerProvider,
+            SpanExportResult=SpanExportResult,
+        )
+    finally:
+        for name in [
+            name
+            for name in sys.modules
+            if name == "opentelemetry" or name.startswith("opentelemetry.")
+        ]:
+            del sys.modules[name]
+        sys.modules.update(stubs)
+        # The cached processor class subclasses the SDK imported above
+        _concurrent_batch_processor_cls.cache_clear()
+
+
+class _RecordingExporter:
+    """Span exporter double that records calls and returns a fixed result."""
+
+    def __init__(self, otel, delay: float = 0.0, fail: bool = False):
+        self._otel = otel
+        self._delay = delay
+        self._result = (
+            otel.SpanExportResult.FAILURE if fail else otel.SpanExportResult.SUCCESS
+        )
+        self.exported: list = []
+        self.suppressed: list = []
+        self.events: list[str] = []
+
+    def export(self, spans):
+        self.suppressed.append(self._otel.context.get_value(self._otel.suppress_key))
+        time.sleep(self._delay)
+        self.exported.extend(spans)
+        self.events.append("export")
+        return self._result
+
+    def shutdown(self):
+        self.events.append("shutdown")
+
+    def force_flush(self, timeout_millis: int = 30000):
+        return True
+
+
+def _export_suppressed(otel, exporter, spans):
+    """Call exporter.export the way the batch processor does."""
+    token = otel.context.attach(otel.context.set_value(otel.suppress_key, True))
+    try:
+        return exporter.export(spans)
+    finally:
+        otel.context.detach(token)
+
+
+def test_fanout_reports_failure_and_keeps_suppression(otel):
+    """A failing endpoint fails the batch; every endpoint still gets the spans."""
+    slow = _RecordingExporter(otel, delay=0.1)
+    failing = _RecordingExporter(otel, fail=True)
+    fanout = _FanoutSpanExporter([slow, failing])
+
+    result = _export_suppressed(otel, fanout, ["span"])
+
+    assert result is otel.SpanExportResult.FAILURE
+    assert slow.exported == ["span"]
+    assert failing.exported == ["span"]
+    assert slow.suppressed == [True]
+    assert failing.suppressed == [True]
+    fanout.shutdown()
+
+
+def test_fanout_shutdown_waits_for_in_flight_export(otel):
+    """Exporters are shut down only after a running export has finished."""
+    slow = _RecordingExporter(otel, delay=0.2)
+    failing = _RecordingExporter(otel, fail=True)
+    fanout = _FanoutSpanExporter([slow, failing])
+
+    worker = threading.Thread(target=fanout.export, args=(["span"],))
+    worker.start()
+    time.sleep(0.05)
+    fanout.shutdown()
+    worker.join()
+
+    assert slow.events == ["export", "shutdown"]
+    assert failing.events == ["export", "shutdown"]
+
+
+def test_fanout_slow_endpoint_times_out_without_blocking_others(otel):
+    """A hung endpoint fails its batches after the timeout; others keep going."""
+    hung = _RecordingExporter(otel, delay=0.5)
+    fast = _RecordingExporter(otel)
+    fanout = _FanoutSpanExporter([hung, fast], timeout_millis=50)
+
+    start = time.monotonic()
+    first = fanout.export(["span-1"])
+    second = fanout.export(["span-2"])
+    elapsed = time.monotonic() - start
+
+    assert first is otel.SpanExportResult.FAILURE
+    assert second is otel.SpanExportResult.FAILURE
+    assert elapsed < 0.4
+    assert fast.exported == ["span-1", "span-2"]
+    fanout.shutdown()
+    assert hung.exported == ["span-1", "span-2"]
+
+
+def _concurrent_provider(otel, inner):
+    """Build a tracer provider exporting through a concurrent exporter."""
+    provider = otel.TracerProvider()
+    processor = _concurrent_batch_processor_cls()(
+        _ConcurrentSpanExporter(inner, 2),
+        # Long delay so only flush or shutdown triggers an export
+        schedule_delay_millis=60_000,
+    )
+    provider.add_span_processor(processor)
+    return provider
+
+
+def _end_span(provider):
+    """Start and end one span on the provider."""
+    with provider.get_tracer("test").start_as_current_span("work"):
+        pass
+
+
+def test_concurrent_force_flush_waits_for_in_flight_export(otel):
+    """force_flush returns only after the slow export has delivered the span."""
+    slow = _RecordingExporter(otel, delay=0.3)
+    provider = _concurrent_provider(otel, slow)
+    _end_span(provider)
+
+    assert provider.force_flush() is True
+    assert len(slow.exported) == 1
+    assert slow.suppressed == [True]
+    provider.shutdown()
+
+
+def test_concurrent_shutdown_exports_then_shuts_down(otel):
+    """Shutdown delivers queued spans before shutting down the exporter."""
+    slow = _RecordingExporter(otel, delay=0.2)
+    provider = _concurrent_provider(otel, slow)
+    _end_span(provider)
+
+    provider.shutdown()
+
+    assert len(slow.exported) == 1
+    assert slow.events == ["export", "shutdown"]
+
+
+def test_concurrent_export_failure_is_logged(otel, monkeypatch):
+    """A FAILURE result from the wrapped exporter is logged, not dropped."""
+    mock_logger = MagicMock()
+    monkeypatch.setattr(openinference, "logger", mock_logger)
+    failing = _RecordingExporter(otel, fail=True)
+    provider = _concurrent_provider(otel, failing)
+    _end_span(provider)
+
+    assert provider.force_flush() is True
+
+    mock_logger.error.assert_called_once_with(
+        "Failed to export spans", reason="FAILURE"
+    )
+    provider.shutdown()
+
+
+def test_concurrent_export_failure_logged_once_per_outage(otel, monkeypatch):
+    """Repeated failures log once until an export succeeds again."""
+    mock_logger = MagicMock()
+    monkeypatch.setattr(openinference, "logger", mock_logger)
+    inner = _RecordingExporter(otel, fail=True)
+    provider = _concurrent_provider(otel, inner)
+
+    for _ in range(3):
+        _end_span(provider)
+        assert provider.force_flush() is True
+    assert mock_logger.error.call_count == 1
+
+    inner._result = otel.SpanExportResult.SUCCESS
+    _end_span(provider)
+    assert provider.force_flush() is True
+    inner._result = otel.SpanExportResult.FAILURE
+    _end_span(provider)
+    assert provider.force_flush() is True
+
+    assert mock_logger.error.call_count == 2
+    assert len(inner.exported) == 5
+    provider.shutdown()
@@ -1,9 +1,11 @@
 """Unit tests for Payment Handler."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from bindu.server.storage.base import Storage
 from bindu.server.workers.helpers.payment_handler import PaymentHandler
 
 
@@ -40,6 +42,17 @@ class TestPaymentHandler:
             result = PaymentHandler.parse_payment_payload({"invalid": "data"})
             assert result is None
 
+    @pytest.mark.parametrize("data", ["scheme=onchain", 42, ["onchain"]])
+    def test_parse_payment_payload_non_dict_skips_validation(self, data):
+        """Test non-dict payloads are rejected without calling the validator."""
+        with patch(
+            "bindu.server.workers.helpers.payment_handler.PaymentPayload"
+        ) as mock_pp:
+            result = PaymentHandler.parse_payment_payload(data)
+        assert result is None
+        mock_pp.model_validate.assert_not_called()
+        mock_pp.assert_not_called()
+
     def test_parse_payment_requirements_none(self):
         """Test parsing None payment requirements."""
         result = PaymentHandler.parse_payment_requirements(None)
@@ -144,6 +157,26 @@ class TestPaymentHandler:
         result = PaymentHandler.select_requirement(required, payload)
         assert result is not None
 
+    def test_settlement_receipt_reused_for_same_transaction(self):
+        """Test replayed settle responses are only serialized once."""
+        from bindu.server.workers.helpers import payment_handler
+
+        settle_response = MagicMock()
+        settle_response.success = True
+        settle_response.error_reason = None
+        settle_response.transaction = "0xabc123"
+        settle_response.model_dump = MagicMock(
+            return_value={"success": True, "transaction": "0xabc123"}
+        )
+
+        with patch.dict(payment_handler._RECEIPT_CACHE, clear=True):
+            first = payment_handler._settlement_receipt(settle_response)
+            second = payment_handler._settlement_receipt(settle_response)
+
+        settle_response.model_dump.assert_called_once_with(by_alias=True)
+        assert first == second == {"success": True, "transaction": "0xabc123"}
+        assert first is not second
+
     @pytest.mark.asyncio
     async def test_settle_payment_success(self):
         """Test successful payment settlement."""
@@ -446,3 +479,115 @@ class TestPaymentHandler:
         lifecycle_notifier.assert_called_once_with(
             "task-123", "ctx-456", "input-required", False
         )
+
+    @pytest.mark.asyncio
+    async def test_handle_settlement_failure_batched(self):
+        """Test batched settlement failures are written by the flusher."""
+        storage = MagicMock(spec=Storage)
+        storage.update_task = AsyncMock()
+        lifecycle_notifier = MagicMock(return_value=None)
+
+        try:
+            with patch(
+                "bindu.server.workers.helpers.payment_handler._BATCH_SETTLEMENT_FAILURES",
+                True,
+            ):
+                for task_id in ("task-1", "task-2"):
+                    await PaymentHandler._handle_settlement_failure(
+                        {"id": task_id, "context_id": "ctx-456"},
+                        "Payment failed",
+                        None,
+                        storage,
+                        lifecycle_notifier,
+                    )
+                await asyncio.sleep(0.2)
+        finally:
+            # Stop the background flusher so no task outlives the test
+            await PaymentHandler.drain_settlement_failures()
+
+        updates = [call.kwargs for call in storage.update_task.await_args_list]
+        assert [u["task_id"] for u in updates] == ["task-1", "task-2"]
+        assert all(u["state"] == "input-required" for u in updates)
+        assert lifecycle_notifier.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batched_settlement_failure_write_error(self):
+        """Test a failed write skips only its own task's notification."""
+        storage = MagicMock(spec=Storage)
+        storage.update_task = AsyncMock(side_effect=[Exception("db down"), None])
+        lifecycle_notifier = MagicMock(return_value=None)
+
+        with patch(
+            "bindu.server.workers.helpers.payment_handler._BATCH_SETTLEMENT_FAILURES",
+            True,
+        ):
+            for task_id in ("task-1", "task-2"):
+                await PaymentHandler._handle_settlement_failure(
+                    {"id": task_id, "context_id": "ctx-456"},
+                    "Payment failed",
+                    None,
+                    storage,
+                    lifecycle_notifier,
+                )
+            await PaymentHandler.drain_settlement_failures()
+
+        assert storage.update_task.await_count == 2
+        lifecycle_notifier.assert_called_once_with(
+            "task-2", "ctx-456", "input-required", False
+        )
+
+    @pytest.mark.asyncio
+    async def test_drain_settlement_failures_writes_queued_failures(self):
+        """Test draining persists queued failures and stops the flusher."""
+        from bindu.server.workers.helpers import payment_handler
+
+        storage = MagicMock(spec=Storage)
+        storage.update_task = AsyncMock()
+
+        with patch(
+            "bindu.server.workers.helpers.payment_handler._BATCH_SETTLEMENT_FAILURES",
+            True,
+        ):
+            await PaymentHandler._handle_settlement_failure(
+                {"id": "task-1", "context_id": "ctx-456"},
+                "Payment failed",
+                None,
+                storage,
+            )
+            flusher = payment_handler._failure_flusher
+            await PaymentHandler.drain_settlement_failures()
+
+        assert flusher.done()
+        assert payment_handler._failure_flusher is None
+        storage.update_task.assert_awaited_once()
+        assert storage.update_task.call_args.kwargs["task_id"] == "task-1"
+
+    def test_settlement_failures_survive_event_loop_change(self):
+        """Test failures queued on a finished loop are written on the next one."""
+        storage = MagicMock(spec=Storage)
+        storage.update_task = AsyncMock()
+
+        async def fail(task_id):
+            await PaymentHandler._handle_settlement_failure(
+                {"id": task_id, "context_id": "ctx-456"},
+                "Payment failed",
+                None,
+                storage,
+            )
+
+        async def fail_and_drain(task_id):
+            await fail(task_id)
+            await PaymentHandler.drain_settlement_failures()
+
+        with patch(
+            "bindu.server.workers.helpers.payment_handler._BATCH_SETTLEMENT_FAILURES",
+            True,
+        ):
+            # The first loop closes before its flusher writes anything
+            asyncio.run(fail("task-1"))
+            asyncio.run(fail_and_drain("task-2"))
+
+        written = [
+            call.kwargs["task_id"] for call in storage.update_task.await_args_list
+        ]
+        assert sorted(written) == ["task-1", "task-2"]
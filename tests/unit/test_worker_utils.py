@@ -77,6 +77,21 @@ class TestMessageConverter:
         assert "task_id" not in messages[0]
         assert "context_id" not in messages[0]
 
+    @pytest.mark.parametrize("with_ids", [True, False])
+    @pytest.mark.parametrize("text", ["Payment failed", "", "multi\nline ünïcode"])
+    def test_to_error_message_matches_general_converter(self, text, with_ids):
+        """Test to_error_message builds the same message as to_protocol_messages."""
+        ids = (uuid4(), uuid4()) if with_ids else (None, None)
+
+        fast = MessageConverter.to_error_message(text, *ids)
+        general = MessageConverter.to_protocol_messages(text, *ids)
+
+        assert len(fast) == len(general) == 1
+        fast_msg = {k: v for k, v in fast[0].items() if k != "message_id"}
+        general_msg = {k: v for k, v in general[0].items() if k != "message_id"}
+        assert fast_msg == general_msg
+        assert fast[0]["message_id"] != general[0]["message_id"]
+
 
 class TestPartConverter:
     """Test PartConverter class."""